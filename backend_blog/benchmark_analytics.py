@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Personal Blog System - Analytics Benchmarks
+Python script for measuring the performance of the analytics module
+"""
+
+import argparse
+import json
+import os
+import platform
+import py_compile
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ANALYTICS_SCRIPT = Path(__file__).parent / 'blog_analytics.py'
+ANALYTICS_MODULE = Path(__file__).parent / 'blog_analytics_core.py'
+
+# Modules the statistics commands must not pull in at startup
+HEAVY_MODULES = ['matplotlib', 'pandas', 'seaborn', 'wordcloud', 'numpy']
+
+def write_sample_data(data_dir):
+    """Write a tiny dataset so startup measurements aren't dominated by parsing"""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    posts = [
+        {
+            'id': i,
+            'title': f'Sample post {i}',
+            'content': '<p>Lorem ipsum dolor sit amet</p>',
+            'category': 'programming',
+            'tags': ['python'],
+            'date': f'2024-01-{i:02d}',
+            'published': True,
+            'views': 100 * i,
+            'likes': i,
+            'comments': 1
+        }
+        for i in range(1, 11)
+    ]
+    comments = [
+        {'id': i, 'postId': i, 'content': 'Great post!', 'date': f'2024-01-{i:02d} 12:00:00', 'approved': True}
+        for i in range(1, 11)
+    ]
+
+    for name, data in (('posts.json', posts), ('comments.json', comments),
+                       ('categories.json', []), ('settings.json', {})):
+        with open(data_dir / name, 'w') as f:
+            json.dump(data, f)
+
+# Methods timed by the suite: name -> (analytics, output directory) -> result
+BENCHMARK_METHODS = {
+    'get_blog_overview': lambda analytics, out_dir: analytics.get_blog_overview(),
+    'get_content_analysis': lambda analytics, out_dir: analytics.get_content_analysis(),
+    'get_engagement_analysis': lambda analytics, out_dir: analytics.get_engagement_analysis(),
+    'get_category_performance': lambda analytics, out_dir: analytics.get_category_performance(),
+    'get_temporal_analysis': lambda analytics, out_dir: analytics.get_temporal_analysis(),
+    'get_top_performing_content': lambda analytics, out_dir: analytics.get_top_performing_content(),
+    'get_seo_analysis': lambda analytics, out_dir: analytics.get_seo_analysis(),
+    'generate_insights': lambda analytics, out_dir: analytics.generate_insights(),
+    'generate_report': lambda analytics, out_dir: analytics.generate_report(str(out_dir / 'report.md')),
+    'export_to_csv': lambda analytics, out_dir: analytics.export_to_csv(str(out_dir / 'export')),
+    'create_visualizations': lambda analytics, out_dir: analytics.create_visualizations(str(out_dir / 'charts'),
+                                                                                        dpi=72)
+}
+
+RESULTS_VERSION = 1
+
+# Vocabulary of the generated posts and comments
+WORDS = ('javascript python php css html react api database server design performance cache query index '
+         'function class module test deploy build release feature bug fix refactor async request response '
+         'browser mobile layout grid flexbox component state data model view route security token user '
+         'the a of to and in is for with on that this it as are be by from or an can we you will').split()
+TAGS = ['javascript', 'es6', 'programming', 'tutorial', 'responsive', 'css', 'mobile', 'design', 'php',
+        'python', 'api', 'database', 'performance', 'security', 'testing', 'devops', 'react', 'tips']
+
+# Categories and settings as api.php initializes them
+CATEGORIES = [
+    ('programming', 'Programming', 'Programming languages, frameworks, and development techniques', '#3498db'),
+    ('web-development', 'Web Development', 'Frontend and backend web development topics', '#e74c3c'),
+    ('technology', 'Technology', 'Latest technology trends and innovations', '#27ae60'),
+    ('tutorials', 'Tutorials', 'Step-by-step guides and how-to articles', '#f39c12')
+]
+SETTINGS = {
+    'siteName': 'TechBlog',
+    'siteDescription': 'Exploring technology, sharing knowledge, and building the future',
+    'siteUrl': 'https://techblog.example.com',
+    'authorName': 'John Developer',
+    'authorEmail': 'john@example.com',
+    'postsPerPage': 10,
+    'commentsEnabled': True,
+    'moderateComments': True,
+    'allowGuestComments': True
+}
+
+def write_json_array(file_path, records):
+    """Write records as a JSON array one at a time, so huge datasets never sit in memory"""
+    with open(file_path, 'w') as f:
+        f.write('[')
+        for i, record in enumerate(records):
+            f.write(',\n' if i else '\n')
+            f.write(json.dumps(record))
+        f.write('\n]')
+
+def sentence(rng, words):
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+def generate_dataset(data_dir, posts=1000, comments=None, words=400, days=3 * 365, seed=0):
+    """Write a synthetic blog with the record layout api.php's createPost and createComment write.
+
+    Posts are dated evenly over the last `days` days in file order; comments
+    (3 per post by default) go to posts with a skew towards popular ones and
+    are dated within 60 days after them, before the end of the data set. A
+    post's comments counter is its number of approved comments, as
+    updatePostCommentCount keeps it.
+    """
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    if comments is None:
+        comments = 3 * posts
+
+    # Pre-built paragraphs keep generation fast; posts draw a few of them
+    paragraphs = [f"<p>{' '.join(sentence(rng, rng.randint(8, 20)) for _ in range(5))}</p>" for _ in range(200)]
+    paragraph_words = sum(len(p.split()) for p in paragraphs) / len(paragraphs)
+
+    end = datetime(2024, 12, 31, 12, 0, 0)
+    first_id = 1700000000000
+
+    def post_time(index):
+        # The newest post is one spacing before the end, so its comments have time to arrive
+        return end - timedelta(days=days * (posts - index) / max(posts, 1))
+
+    # Comments first, so the posts' comment counters can match them
+    approved_counts = array('i', [0]) * posts
+
+    def comment_records():
+        for i in range(comments if posts else 0):
+            # Half of the comments go to the newest posts (Pareto-distributed), the rest anywhere
+            if rng.random() < 0.5:
+                index = posts - min(int(rng.paretovariate(1.2)), posts)
+            else:
+                index = rng.randrange(posts)
+            approved = rng.random() < 0.85
+            if approved:
+                approved_counts[index] += 1
+            posted = post_time(index)
+            minutes_left = int((end - posted).total_seconds() // 60)
+            written = posted + timedelta(minutes=rng.randint(min(5, minutes_left), min(60 * 24 * 60, minutes_left)))
+            yield {
+                'id': first_id + posts + i,
+                'postId': first_id + index,
+                'author': f'Reader {rng.randint(1, 5000)}',
+                'email': f'reader{rng.randint(1, 5000)}@example.com',
+                'website': '',
+                'content': sentence(rng, rng.randint(4, 60)),
+                'date': written.strftime('%Y-%m-%d %H:%M:%S'),
+                'approved': approved,
+                'ip': f'203.0.113.{rng.randint(1, 254)}',
+                'userAgent': 'Mozilla/5.0 (X11; Linux x86_64)',
+                'createdAt': written.isoformat() + '+00:00',
+                'updatedAt': written.isoformat() + '+00:00'
+            }
+
+    def post_records():
+        for index in range(posts):
+            title = sentence(rng, rng.randint(3, 10))[:-1]
+            excerpt = sentence(rng, rng.randint(12, 30))
+            created = post_time(index)
+            views = int(rng.lognormvariate(6, 1.2))
+            yield {
+                'id': first_id + index,
+                'title': title,
+                'slug': '-'.join(title.lower().split()) + f'-{index}',
+                'excerpt': excerpt,
+                'content': ''.join(rng.choice(paragraphs)
+                                   for _ in range(max(1, round(rng.gauss(words, words / 3) / paragraph_words)))),
+                'category': rng.choice(CATEGORIES)[0],
+                'tags': rng.sample(TAGS, rng.randint(0, 5)),
+                'author': 'John Developer',
+                'authorEmail': 'john@example.com',
+                'date': created.strftime('%Y-%m-%d'),
+                'image': f'https://images.unsplash.com/photo-{rng.randint(10 ** 9, 10 ** 10)}?w=600&h=300' if rng.random() < 0.7 else '',
+                'featured': rng.random() < 0.05,
+                'published': rng.random() < 0.9,
+                'comments': approved_counts[index],
+                'views': views,
+                'likes': int(views * rng.uniform(0, 0.1)),
+                'metaTitle': f'{title} - TechBlog',
+                'metaDescription': excerpt,
+                'createdAt': created.isoformat() + '+00:00',
+                'updatedAt': (created + timedelta(days=rng.randint(0, 30))).isoformat() + '+00:00'
+            }
+
+    write_json_array(data_dir / 'comments.json', comment_records())
+    write_json_array(data_dir / 'posts.json', post_records())
+
+    created = end.isoformat() + '+00:00'
+    with open(data_dir / 'categories.json', 'w') as f:
+        json.dump([{'id': slug, 'name': name, 'slug': slug, 'description': description, 'image': '',
+                    'color': color, 'active': True, 'createdAt': created, 'updatedAt': created}
+                   for slug, name, description, color in CATEGORIES], f, indent=4)
+    with open(data_dir / 'settings.json', 'w') as f:
+        json.dump(dict(SETTINGS, createdAt=created, updatedAt=created), f, indent=4)
+
+def run_generate(args):
+    """Write a synthetic dataset to the given directory"""
+    generate_dataset(args.data_dir, args.posts, args.comments, args.words, seed=args.seed)
+    print(f"Dataset written to: {args.data_dir}")
+    return 0
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KiB"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def run_measure(args):
+    """Time one method on a fresh BlogAnalytics in this process and print the result as JSON"""
+    sys.path.insert(0, str(ANALYTICS_SCRIPT.parent))
+    from blog_analytics import BlogAnalytics
+    import contextlib
+    import io
+
+    result = {'method': args.method}
+    analytics = BlogAnalytics(args.data_dir, engine=args.engine, workers=args.workers)
+    with tempfile.TemporaryDirectory() as out_dir:
+        baseline_kb = peak_rss_kb()
+        start = time.perf_counter()
+        try:
+            # Methods that report print; keep the JSON on stdout clean
+            with contextlib.redirect_stdout(io.StringIO()):
+                BENCHMARK_METHODS[args.method](analytics, Path(out_dir))
+            result['status'] = 'ok'
+        except ImportError as e:
+            result['status'] = 'skipped'
+            result['error'] = str(e)
+        except Exception as e:
+            result['status'] = 'error'
+            result['error'] = f'{type(e).__name__}: {e}'
+        result['wall_ms'] = (time.perf_counter() - start) * 1000
+        result['peak_rss_kb'] = peak_rss_kb()
+        result['baseline_rss_kb'] = baseline_kb
+    print(json.dumps(result))
+    return 0
+
+def measure_method(method, data_dir, engine='auto', workers=1):
+    """Run one method in a fresh interpreter, so timings and peak RSS don't depend on earlier methods"""
+    output = subprocess.run([sys.executable, str(Path(__file__).resolve()), 'measure', method,
+                             '--data-dir', str(data_dir), '--engine', engine, '--workers', str(workers)],
+                            capture_output=True, text=True)
+    if output.returncode != 0:
+        return {'method': method, 'status': 'error', 'error': output.stderr.strip().splitlines()[-1:]}
+    return json.loads(output.stdout.splitlines()[-1])
+
+def run_suite(args):
+    """Time every public method at each scale and write the results as JSON"""
+    methods = args.methods or list(BENCHMARK_METHODS)
+    unknown = set(methods) - set(BENCHMARK_METHODS)
+    if unknown:
+        print(f"Unknown methods: {', '.join(sorted(unknown))}")
+        return 1
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        work_dir = Path(args.work_dir or tmp_dir)
+        for scale in args.scales:
+            comments = scale * args.comments_per_post
+            data_dir = work_dir / f'blog_{scale}_{comments}_{args.words}_{args.seed}'
+            if not (data_dir / 'settings.json').exists():
+                print(f"Generating {scale:,} posts and {comments:,} comments in {data_dir}")
+                generate_dataset(data_dir, scale, comments, args.words, seed=args.seed)
+
+            for method in methods:
+                runs = [measure_method(method, data_dir, args.engine, args.workers) for _ in range(args.repeat)]
+                result = dict(runs[-1], scale=scale, posts=scale, comments=comments)
+                if all(run['status'] == 'ok' for run in runs):
+                    result['wall_ms'] = round(statistics.median(run['wall_ms'] for run in runs), 2)
+                    result['peak_rss_kb'] = max(run['peak_rss_kb'] for run in runs)
+                    result['runs_ms'] = [round(run['wall_ms'], 2) for run in runs]
+                results.append(result)
+
+                if result['status'] == 'ok':
+                    print(f"{scale:>10,} {method:<28} {result['wall_ms']:>10.1f} ms {result['peak_rss_kb'] / 1024:>8.1f} MiB")
+                else:
+                    print(f"{scale:>10,} {method:<28} {result['status']}: {result.get('error')}")
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'engine': args.engine,
+            'workers': args.workers,
+            'repeat': args.repeat,
+            'results': results
+        }, f, indent=2)
+    print(f"Results saved to: {args.output}")
+    return 0
+
+def run_compare(args):
+    """Compare two suite result files and fail on time or memory regressions"""
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    previous = {(r['scale'], r['method']): r for r in baseline['results'] if r['status'] == 'ok'}
+    failed = False
+    for result in current['results']:
+        before = previous.get((result['scale'], result['method']))
+        if before is None or result['status'] != 'ok':
+            continue
+
+        time_ratio = result['wall_ms'] / max(before['wall_ms'], 0.001)
+        rss_ratio = result['peak_rss_kb'] / max(before['peak_rss_kb'], 1)
+        # Differences under min-ms are noise, whatever the ratio
+        slower = time_ratio > args.max_slowdown and result['wall_ms'] - before['wall_ms'] > args.min_ms
+        status = 'FAIL' if slower or rss_ratio > args.max_rss_growth else 'OK'
+        failed = failed or status == 'FAIL'
+        print(f"{status}: {result['scale']:>10,} {result['method']:<28} "
+              f"{before['wall_ms']:>10.1f} -> {result['wall_ms']:>10.1f} ms (x{time_ratio:.2f}), "
+              f"{before['peak_rss_kb'] / 1024:.1f} -> {result['peak_rss_kb'] / 1024:.1f} MiB (x{rss_ratio:.2f})")
+
+    return 1 if failed else 0
+
+def imported_heavy_modules():
+    """Return the heavy modules that importing the analytics module pulls in"""
+    code = (
+        "import sys; sys.path.insert(0, {path!r}); import blog_analytics; "
+        "print(' '.join(m for m in {heavy!r} if m in sys.modules))"
+    ).format(path=str(ANALYTICS_SCRIPT.parent), heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return output.stdout.split()
+
+def measure_startup(command, data_dir, runs=10):
+    """Run the analytics CLI `runs` times and return the wall times in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(ANALYTICS_SCRIPT), command, '--data-dir', str(data_dir)],
+                       stdout=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def run_startup_benchmark(args):
+    """Benchmark CLI startup and fail when it regresses past the budget"""
+    failed = False
+
+    heavy = imported_heavy_modules()
+    if heavy:
+        print(f"FAIL: importing blog_analytics loads {', '.join(heavy)}")
+        failed = True
+    else:
+        print("OK: importing blog_analytics loads no plotting or dataframe libraries")
+
+    # The CLI script imports the library, which normally starts from its cached
+    # bytecode; write it here too, in case bytecode writing is disabled
+    py_compile.compile(str(ANALYTICS_MODULE), doraise=True)
+
+    # Baseline: a bare interpreter start, so the budget is relative to this machine
+    baseline = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        baseline.append((time.perf_counter() - start) * 1000)
+    baseline_ms = statistics.median(baseline)
+    print(f"Interpreter startup: {baseline_ms:.1f} ms (median of {args.runs})")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = args.data_dir or tmp_dir
+        if not args.data_dir:
+            write_sample_data(data_dir)
+
+        for command in args.commands:
+            median_ms = statistics.median(measure_startup(command, data_dir, args.runs))
+            overhead_ms = median_ms - baseline_ms
+            status = 'OK' if overhead_ms <= args.max_ms else 'FAIL'
+            failed = failed or status == 'FAIL'
+            print(f"{status}: '{command}' took {median_ms:.1f} ms "
+                  f"({overhead_ms:.1f} ms over interpreter startup, budget {args.max_ms:.0f} ms)")
+
+    return 1 if failed else 0
+
+def rank_error(sorted_values, value, q):
+    """Distance of q from the normalized rank range of value in sorted_values"""
+    low = bisect_left(sorted_values, value) / len(sorted_values)
+    high = bisect_right(sorted_values, value) / len(sorted_values)
+    return 0.0 if low <= q <= high else min(abs(low - q), abs(high - q))
+
+def run_sketch_accuracy(args):
+    """Check that quantile sketches sized for a rank error stay within it"""
+    sys.path.insert(0, str(ANALYTICS_SCRIPT.parent))
+    from blog_analytics import QuantileSketch
+
+    quantiles = [i / 100 for i in range(1, 100)]
+    failed = False
+    for error in args.errors:
+        k = QuantileSketch.k_for_error(error)
+        worst = dict.fromkeys(('random stream', 'ascending stream', 'merged shards'), 0.0)
+        for seed in range(args.seeds):
+            rng = random.Random(seed)
+            values = [rng.random() for _ in range(args.values)]
+            ordered = sorted(values)
+            shards = [QuantileSketch(k).extend(values[i::4]) for i in range(4)]
+            merged = QuantileSketch(k)
+            for shard in shards:
+                merged.merge(QuantileSketch.from_dict(shard.to_dict()))
+            sketches = {
+                'random stream': QuantileSketch(k).extend(values),
+                'ascending stream': QuantileSketch(k).extend(ordered),
+                # Shards are compacted when serialized, and once more after merging
+                'merged shards': QuantileSketch.from_dict(merged.to_dict())
+            }
+            for name, sketch in sketches.items():
+                for q, value in zip(quantiles, sketch.quantiles(quantiles)):
+                    worst[name] = max(worst[name], rank_error(ordered, value, q))
+
+        for name, observed in worst.items():
+            status = 'OK' if observed <= error else 'FAIL'
+            failed = failed or status == 'FAIL'
+            print(f"{status}: error {error} (k={k}), {name}: worst rank error {observed:.4f} "
+                  f"over {args.seeds} x {args.values} values")
+
+    return 1 if failed else 0
+
+def main():
+    """Main function for command-line usage"""
+    parser = argparse.ArgumentParser(description='Personal Blog Analytics benchmarks')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    startup = subparsers.add_parser('startup', help='measure CLI startup time of the statistics commands')
+    startup.add_argument('commands', nargs='*', default=['overview', 'insights'])
+    startup.add_argument('--runs', type=int, default=10)
+    startup.add_argument('--max-ms', type=float, default=150.0,
+                         help='allowed time over a bare interpreter start (median)')
+    startup.add_argument('--data-dir', default=None,
+                         help='data directory to benchmark against (default: a tiny sample dataset)')
+    startup.set_defaults(run=run_startup_benchmark)
+
+    sketch = subparsers.add_parser('sketch', help='check the rank error of the quantile sketches')
+    sketch.add_argument('--errors', type=float, nargs='+', default=[0.05, 0.02, 0.01],
+                        help='requested rank errors (as --quantile-error takes them)')
+    sketch.add_argument('--seeds', type=int, default=8)
+    sketch.add_argument('--values', type=int, default=100000, help='uniform random values per seed')
+    sketch.set_defaults(run=run_sketch_accuracy)
+
+    generate = subparsers.add_parser('generate', help='write a synthetic dataset in the api.php record layout')
+    generate.add_argument('data_dir')
+    generate.add_argument('--posts', type=int, default=1000)
+    generate.add_argument('--comments', type=int, default=None, help='default: 3 per post')
+    generate.add_argument('--words', type=int, default=400, help='average words per post')
+    generate.add_argument('--seed', type=int, default=0)
+    generate.set_defaults(run=run_generate)
+
+    suite = subparsers.add_parser('suite', help='time every public method on generated datasets')
+    suite.add_argument('--scales', type=int, nargs='+', default=[1000, 10000],
+                       help='posts per dataset (e.g. 1000 100000 10000000)')
+    suite.add_argument('--comments-per-post', type=int, default=3)
+    suite.add_argument('--words', type=int, default=400, help='average words per post')
+    suite.add_argument('--seed', type=int, default=0)
+    suite.add_argument('--methods', nargs='*', default=None, help='default: all of them')
+    suite.add_argument('--repeat', type=int, default=3, help='runs per method (median time, max RSS)')
+    suite.add_argument('--engine', choices=['auto', 'python', 'numpy'], default='auto')
+    suite.add_argument('--workers', type=int, default=1)
+    suite.add_argument('--work-dir', default=None,
+                       help='keep the generated datasets here and reuse them (default: a temporary directory)')
+    suite.add_argument('--output', default='benchmark_results.json')
+    suite.set_defaults(run=run_suite)
+
+    compare = subparsers.add_parser('compare', help='compare two suite result files')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--max-slowdown', type=float, default=1.25, help='allowed wall time ratio')
+    compare.add_argument('--max-rss-growth', type=float, default=1.25, help='allowed peak RSS ratio')
+    compare.add_argument('--min-ms', type=float, default=5.0, help='ignore slowdowns smaller than this')
+    compare.set_defaults(run=run_compare)
+
+    measure = subparsers.add_parser('measure', help='time one method in this process (used by suite)')
+    measure.add_argument('method', choices=sorted(BENCHMARK_METHODS))
+    measure.add_argument('--data-dir', required=True)
+    measure.add_argument('--engine', choices=['auto', 'python', 'numpy'], default='auto')
+    measure.add_argument('--workers', type=int, default=1)
+    measure.set_defaults(run=run_measure)
+
+    args = parser.parse_args()
+    sys.exit(args.run(args))
+
+if __name__ == "__main__":
+    main()
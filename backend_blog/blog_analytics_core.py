@@ -0,0 +1,4606 @@
+#!/usr/bin/env python3
+"""
+Personal Blog System - Analytics Module
+Implementation of the blog performance and reader engagement analytics;
+blog_analytics.py re-exports it and runs its command line
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from datetime import date, datetime, timedelta
+from collections import defaultdict, deque, namedtuple, Counter
+from pathlib import Path
+import re
+import heapq
+import math
+import sqlite3
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+# matplotlib, seaborn, wordcloud, pyarrow and numpy are imported lazily inside
+# create_visualizations, create_word_cloud and export_to_csv so that the
+# statistics commands start quickly and only need the standard library. The
+# worker pools (concurrent.futures pulls in multiprocessing) are imported
+# where they are used for the same reason.
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Fields kept per post once its body has been analyzed, and the comment
+# fields the aggregate needs (ip, userAgent, email... are dropped on load)
+POST_ROW_FIELDS = ('id', 'title', 'category', 'tags', 'date', 'image', 'published',
+                   'views', 'likes', 'comments', 'metaDescription', 'createdAt')
+COMMENT_FIELDS = ('id', 'postId', 'content', 'date', 'approved', 'updatedAt')
+
+# Data files of a blog, as BlogAnalytics attributes (<name> and <name>_file)
+DATA_FILES = ('posts', 'categories', 'comments', 'settings')
+
+def utf8_length(text):
+    """Length of text in UTF-8 bytes"""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+def iter_json_array(file_path, fields=None, chunk_size=1 << 20, offsets=False):
+    """Yield the elements of a top-level JSON array one at a time.
+    
+    The file is read in chunks of chunk_size characters, so memory use is
+    bounded by the largest element rather than the file size. When fields is
+    given, only those keys of each (object) element are kept. With offsets,
+    (element, byte offset, byte length) tuples are yielded instead, so that
+    an element can be read back on its own later (the offsets are None when
+    the file is not an array).
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        # base: byte offset of buffer[mark], kept up to date when offsets are wanted
+        base = 0
+        buffer = f.read(chunk_size)
+        stripped = buffer.lstrip()
+        while buffer and not stripped:
+            if offsets:
+                base += utf8_length(buffer)
+            buffer = f.read(chunk_size)
+            stripped = buffer.lstrip()
+        if not stripped:
+            return
+        
+        pos = len(buffer) - len(stripped)
+        mark = 0
+        eof = False
+        if stripped[0] != '[':
+            # Not an array: fall back to a regular parse of the whole document
+            data = json.loads(stripped + f.read())
+            for element in (data if isinstance(data, list) else [data]):
+                yield (element, None, None) if offsets else element
+            return
+        pos += 1
+        
+        while True:
+            # Skip separators between elements
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                if eof:
+                    raise ValueError(f"Unterminated JSON array in {file_path}")
+                if offsets:
+                    base += utf8_length(buffer[mark:])
+                    mark = 0
+                buffer = f.read(chunk_size)
+                eof = not buffer
+                pos = 0
+                continue
+            if buffer[pos] == ']':
+                return
+            
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+                # A delimiter must follow, or e.g. "12" could be the start of "12.5"
+                complete = eof or (end < len(buffer) and buffer[end] in ' \t\r\n,]')
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            
+            if not complete:
+                # The element straddles the chunk boundary: read more and retry
+                more = f.read(chunk_size)
+                eof = not more
+                if offsets:
+                    base += utf8_length(buffer[mark:pos])
+                    mark = 0
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+            
+            if fields is not None and isinstance(element, dict):
+                element = {key: element[key] for key in fields if key in element}
+            if offsets:
+                start = base + utf8_length(buffer[mark:pos])
+                length = utf8_length(buffer[pos:end])
+                base, mark = start + length, end
+                yield element, start, length
+            else:
+                yield element
+            pos = end
+            
+            # Drop consumed text now and then to keep slicing cheap
+            if pos > chunk_size:
+                buffer = buffer[pos:]
+                pos = 0
+                mark = 0
+
+class RecordSource:
+    """JSON array file that single records are read back from by byte offset.
+    
+    Iterating a RecordSource streams the full records of the file.
+    """
+    
+    def __init__(self, file_path):
+        self.file_path = Path(file_path)
+        self._file = None
+        self._lock = threading.Lock()
+    
+    def __iter__(self):
+        return iter_json_array(self.file_path)
+    
+    def read(self, offset, length):
+        """Decode the length bytes stored at offset"""
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.file_path, 'rb')
+            self._file.seek(offset)
+            data = self._file.read(length)
+        return json.loads(data)
+    
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+class RecordList(list):
+    """Records loaded from a RecordSource"""
+    
+    def __init__(self, source, records=()):
+        super().__init__(records)
+        self.source = source
+
+class Record:
+    """Compact, read-only record of a JSON array file.
+    
+    Only the FIELDS the statistics use are kept, in __slots__, with the
+    INTERNED strings (and string lists) shared between records; any other
+    key, e.g. a post body, is read back from the data file when accessed.
+    Records answer the dict reads the analytics make: record[key], get, in,
+    keys and iteration.
+    """
+    
+    __slots__ = ('_source', '_offset', '_length', 'content_length')
+    FIELDS = ()
+    FIELD_SET = frozenset()
+    INTERNED = frozenset()
+    
+    def __init__(self, element, source, offset, length):
+        self._source = source
+        self._offset = offset
+        self._length = length
+        self.content_length = len(element.get('content', ''))
+        for key in self.FIELDS:
+            if key not in element:
+                continue
+            value = element[key]
+            if key in self.INTERNED:
+                if isinstance(value, str):
+                    value = sys.intern(value)
+                elif isinstance(value, list):
+                    value = [sys.intern(item) if isinstance(item, str) else item for item in value]
+            setattr(self, key, value)
+    
+    def full(self):
+        """The whole record as a dict, read back from the data file"""
+        record = self._source.read(self._offset, self._length)
+        if not isinstance(record, dict) or record.get('id') != getattr(self, 'id', None):
+            raise ValueError(f"{self._source.file_path} changed since it was loaded; call invalidate()")
+        return record
+    
+    def __getitem__(self, key):
+        if key in self.FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return self.full()[key]
+    
+    def get(self, key, default=None):
+        if key in self.FIELD_SET:
+            return getattr(self, key, default)
+        return self.full().get(key, default)
+    
+    def __contains__(self, key):
+        if key in self.FIELD_SET:
+            return hasattr(self, key)
+        return key in self.full()
+    
+    def keys(self):
+        return self.full().keys()
+    
+    def __iter__(self):
+        return iter(self.full())
+    
+    def __len__(self):
+        return len(self.full())
+    
+    def __repr__(self):
+        fields = {key: getattr(self, key) for key in self.FIELDS if hasattr(self, key)}
+        return f"{type(self).__name__}({fields!r})"
+
+class PostRecord(Record):
+    """A post without its content, excerpt and other display-only fields"""
+    
+    FIELDS = POST_ROW_FIELDS + ('updatedAt', 'author')
+    __slots__ = FIELDS
+    FIELD_SET = frozenset(FIELDS)
+    INTERNED = frozenset(('category', 'tags', 'author', 'date'))
+
+class CommentRecord(Record):
+    """A comment without its content, ip, userAgent and contact fields"""
+    
+    FIELDS = tuple(field for field in COMMENT_FIELDS if field != 'content') + ('author',)
+    __slots__ = FIELDS
+    FIELD_SET = frozenset(FIELDS)
+    INTERNED = frozenset(('author', 'date'))
+
+# Compact record type of each data file holding records
+RECORD_TYPES = {'posts': PostRecord, 'comments': CommentRecord}
+
+def content_length(record):
+    """Length of a record's content, without reading a compact record's body"""
+    if isinstance(record, Record):
+        return record.content_length
+    return len(record.get('content', ''))
+
+PostText = namedtuple('PostText', ['text', 'word_count', 'reading_time'])
+
+class ProfileStage:
+    """One timed run of a profiled stage (see StageProfiler.stage)"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.records = 0
+        self.seconds = 0.0
+        self.peak_bytes = None
+
+class StageProfiler:
+    """Wall time, call counts, records processed and allocation peaks per stage.
+    
+    Stages are timed with `with profiler.stage(name) as stage:` (setting
+    stage.records to the number of records handled) and may nest; hot
+    per-record paths account their time with add() instead. With
+    trace_memory, tracemalloc measures how far each stage's allocations peak
+    above what was allocated when it started. Hooks are called with every
+    finished ProfileStage.
+    """
+    
+    COLUMNS = ('calls', 'seconds', 'records', 'peak_bytes')
+    
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stages = {}
+        self.hooks = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+    
+    def _account(self, name, seconds, records, peak_bytes=None):
+        with self._lock:
+            totals = self.stages.setdefault(name, dict.fromkeys(self.COLUMNS, 0))
+            totals['calls'] += 1
+            totals['seconds'] += seconds
+            totals['records'] += records or 0
+            if peak_bytes is not None:
+                totals['peak_bytes'] = max(totals['peak_bytes'], peak_bytes)
+    
+    def add(self, name, seconds, records=0):
+        """Account one call of a stage the caller timed itself (no allocation tracking)"""
+        self._account(name, seconds, records)
+    
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as one call of the named stage"""
+        stage = ProfileStage(name)
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        
+        if self.trace_memory:
+            import tracemalloc
+            # Each open stage keeps [allocated at start, highest allocation seen]; the
+            # tracemalloc peak is reset per stage, so it is folded into the parent first
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            stack.append([current, current])
+        
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - start
+            if self.trace_memory:
+                started, highest = stack.pop()
+                highest = max(highest, tracemalloc.get_traced_memory()[1])
+                stage.peak_bytes = highest - started
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], highest)
+            
+            self._account(name, stage.seconds, stage.records, stage.peak_bytes)
+            for hook in self.hooks:
+                hook(stage)
+    
+    def to_dict(self):
+        """Totals per stage, in the order the stages first ran"""
+        with self._lock:
+            return {name: dict(totals) for name, totals in self.stages.items()}
+    
+    def summary(self):
+        """Totals per stage as a text table"""
+        lines = [f"{'Stage':<32} {'Calls':>7} {'Total ms':>11} {'Mean ms':>10} {'Records':>10} {'Peak KiB':>10}"]
+        for name, totals in self.to_dict().items():
+            peak = f"{totals['peak_bytes'] / 1024:,.0f}" if self.trace_memory and totals['peak_bytes'] else '-'
+            lines.append(f"{name:<32} {totals['calls']:>7} {totals['seconds'] * 1000:>11,.1f} "
+                         f"{totals['seconds'] * 1000 / totals['calls']:>10,.2f} {totals['records']:>10,} {peak:>10}")
+        return '\n'.join(lines)
+
+class TextCache:
+    """Derived text of each post: HTML-stripped body, word count and reading time.
+    
+    Entries are keyed by post id, updatedAt and content length, so a post is
+    only re-stripped when it changes. With a cache_file the entries are kept
+    in a SQLite file and reused by later runs. Word counts and reading times
+    stay in memory; the cleaned text is only held in memory when keep_text is
+    set (e.g. while rendering the word cloud) and fetched from disk otherwise.
+    """
+    
+    FLUSH_EVERY = 1000
+    
+    def __init__(self, cache_file=None, keep_text=False):
+        self.cache_file = Path(cache_file) if cache_file is not None else None
+        self.keep_text = keep_text
+        self.entries = {}
+        self.seen = set()
+        self._pending = []
+        self._conn = None
+        self._loaded = False
+        
+        # StageProfiler accounting the HTML stripping on misses (set by BlogAnalytics)
+        self.profiler = None
+    
+    @staticmethod
+    def key(post):
+        """Cache key of a post's current version (None when the post has no id)"""
+        post_id = post.get('id')
+        if post_id is None:
+            return None
+        return f"{post_id}|{post.get('updatedAt', '')}|{content_length(post)}"
+    
+    @staticmethod
+    def compute(content):
+        """Strip HTML tags and count words (average 200 words per minute)"""
+        text = HTML_TAG_RE.sub('', content)
+        word_count = len(text.split())
+        return PostText(text, word_count, max(1, word_count // 200))
+    
+    def _connect(self):
+        if self._conn is None and self.cache_file is not None:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_file))
+            self._conn.execute('CREATE TABLE IF NOT EXISTS post_text '
+                               '(key TEXT PRIMARY KEY, text TEXT, word_count INTEGER, reading_time INTEGER)')
+        return self._conn
+    
+    def _load(self):
+        """Read the word counts and reading times persisted by earlier runs"""
+        self._loaded = True
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        
+        try:
+            rows = self._connect().execute('SELECT key, word_count, reading_time FROM post_text')
+            for key, word_count, reading_time in rows:
+                self.entries[key] = PostText(None, word_count, reading_time)
+        except sqlite3.Error as e:
+            print(f"Ignoring unreadable text cache {self.cache_file}: {e}")
+            self.entries = {}
+    
+    def lookup(self, post, need_text=False):
+        """Cached derived text of a post, or None when it has to be computed"""
+        if not self._loaded:
+            self._load()
+        
+        key = self.key(post)
+        if key is None:
+            return None
+        self.seen.add(key)
+        
+        entry = self.entries.get(key)
+        if entry is None or entry.text is not None or not (need_text or self.keep_text):
+            return entry
+        
+        text = self._fetch_text(key)
+        if text is None:
+            return None
+        entry = entry._replace(text=text)
+        if self.keep_text:
+            self.entries[key] = entry
+        return entry
+    
+    def store(self, post, entry):
+        """Cache a computed entry (entry.text may be None when only counts were computed)"""
+        key = self.key(post)
+        if key is None:
+            return
+        
+        self.entries[key] = entry if self.keep_text else entry._replace(text=None)
+        if self.cache_file is not None:
+            self._pending.append((key, entry.text, entry.word_count, entry.reading_time))
+            if len(self._pending) >= self.FLUSH_EVERY:
+                self.flush()
+    
+    def get(self, post, need_text=False):
+        """Derived text of a post, computing and caching it on a miss"""
+        entry = self.lookup(post, need_text)
+        if entry is None:
+            start = time.perf_counter()
+            entry = self.compute(post.get('content', ''))
+            if self.profiler is not None:
+                self.profiler.add('strip_html', time.perf_counter() - start, 1)
+            self.store(post, entry)
+        return entry
+    
+    def _fetch_text(self, key):
+        if self.cache_file is None or not self.cache_file.exists():
+            return None
+        
+        try:
+            row = self._connect().execute('SELECT text FROM post_text WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+    
+    def flush(self, prune=False):
+        """Persist new entries; with prune, drop entries of posts not seen since the last prune"""
+        conn = self._connect()
+        if conn is None:
+            return
+        
+        try:
+            with conn:
+                conn.executemany('INSERT OR REPLACE INTO post_text VALUES (?, ?, ?, ?)', self._pending)
+                if prune:
+                    conn.execute('CREATE TEMP TABLE IF NOT EXISTS seen_keys (key TEXT PRIMARY KEY)')
+                    conn.execute('DELETE FROM seen_keys')
+                    conn.executemany('INSERT OR IGNORE INTO seen_keys VALUES (?)', ((key,) for key in self.seen))
+                    conn.execute('DELETE FROM post_text WHERE key NOT IN (SELECT key FROM seen_keys)')
+        except sqlite3.Error as e:
+            print(f"Error writing text cache {self.cache_file}: {e}")
+        
+        self._pending = []
+        if prune:
+            self.entries = {key: entry for key, entry in self.entries.items() if key in self.seen}
+            self.seen = set()
+    
+    def release_text(self):
+        """Stop holding cleaned text in memory (word counts are kept)"""
+        self.keep_text = False
+        for key, entry in self.entries.items():
+            if entry.text is not None:
+                self.entries[key] = entry._replace(text=None)
+    
+    def clear(self):
+        """Forget every entry, in memory and on disk"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self.entries = {}
+        self.seen = set()
+        self._pending = []
+        self._loaded = True
+        if self.cache_file is not None and self.cache_file.exists():
+            self.cache_file.unlink()
+
+def analyze_text_chunk(contents, tag_lists, keep_text=False):
+    """Worker: derived text of a chunk of post bodies, plus the chunk's tag counts"""
+    entries = []
+    for content in contents:
+        entry = TextCache.compute(content)
+        entries.append(entry if keep_text else entry._replace(text=None))
+    
+    tag_frequency = Counter()
+    for tags in tag_lists:
+        tag_frequency.update(tags)
+    return entries, tag_frequency
+
+# Terms of the inverted index: lowercased words (apostrophes kept, a final 's
+# dropped) of at least two letters, minus common English function words
+TERM_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+STOP_WORDS = frozenset("""
+    a about above after again against all also am an and any are as at be because been before being below
+    between both but by can could did do does doing down during each few for from further had has have
+    having he her here hers herself him himself his how i if in into is it its itself just me more most my
+    myself no nor not now of off on once only or other our ours ourselves out over own same she should so
+    some such than that the their theirs them themselves then there these they this those through to too
+    under until up very was we were what when where which while who whom why will with would you your
+    yours yourself yourselves
+""".split())
+
+def term_counts(text):
+    """Term frequencies of a cleaned text (see TERM_RE and STOP_WORDS)"""
+    terms = Counter()
+    for term, count in Counter(TERM_RE.findall(text.lower())).items():
+        if term.endswith("'s"):
+            term = term[:-2]
+        if len(term) > 1 and term not in STOP_WORDS:
+            terms[term] += count
+    return terms
+
+# Parsed dates are memoized per string (many posts and comments share a
+# date); the memos are cleared when they reach this many entries
+DATE_MEMO_SIZE = 100000
+UNIX_EPOCH_DAY = date(1970, 1, 1).toordinal()
+
+class DayNumbers(dict):
+    """Memo of date strings to day numbers (proleptic Gregorian ordinals, 0 when invalid)"""
+    
+    def __init__(self, parse):
+        super().__init__()
+        self.parse = parse
+    
+    def __missing__(self, value):
+        try:
+            day = self.parse(value).toordinal()
+        except (TypeError, ValueError):
+            day = 0
+        if len(self) >= DATE_MEMO_SIZE:
+            self.clear()
+        self[value] = day
+        return day
+
+_post_days = DayNumbers(lambda value: datetime.strptime(value, '%Y-%m-%d'))
+_iso_days = DayNumbers(date.fromisoformat)
+_calendar_keys = {}
+
+def post_day(date_str):
+    """Publication day of a post ('%Y-%m-%d') as a day number, 0 when missing or invalid"""
+    return _post_days[date_str] if date_str and isinstance(date_str, str) else 0
+
+def iso_day(value):
+    """Day number of an ISO date ('YYYY-MM-DD'), 0 when missing or invalid"""
+    return _iso_days[value] if value and isinstance(value, str) else 0
+
+def calendar_keys(day):
+    """Month ('YYYY-MM'), weekday name and ISO week ('YYYY-Www') of a day number"""
+    keys = _calendar_keys.get(day)
+    if keys is None:
+        day_date = date.fromordinal(day)
+        iso_year, iso_week, _ = day_date.isocalendar()
+        keys = (day_date.strftime('%Y-%m'), WEEKDAY_NAMES[day_date.weekday()], f'{iso_year}-W{iso_week:02d}')
+        if len(_calendar_keys) >= DATE_MEMO_SIZE:
+            _calendar_keys.clear()
+        _calendar_keys[day] = keys
+    return keys
+
+def parse_timestamp(value):
+    """Seconds from 1970-01-01 to an ISO date or date and time (wall-clock, any UTC offset ignored), or None"""
+    if not value or not isinstance(value, str):
+        return None
+    
+    # Fast path for 'YYYY-MM-DD HH:MM:SS': the date part goes through the memo
+    if len(value) == 19 and value[10] in ' T' and value[13] == value[16] == ':' and value.isascii():
+        clock = value[11:13] + value[14:16] + value[17:19]
+        day = iso_day(value[:10]) if value[4] == value[7] == '-' and clock.isdigit() else 0
+        if day:
+            hour, minute, second = int(clock[:2]), int(clock[2:4]), int(clock[4:])
+            if hour < 24 and minute < 60 and second < 60:
+                return (day - UNIX_EPOCH_DAY) * 86400 + hour * 3600 + minute * 60 + second
+    
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return int((moment.replace(tzinfo=None) - datetime(1970, 1, 1)).total_seconds())
+
+def post_created(post):
+    """Timestamp a post went online: its createdAt, else midnight of its publication date (None when neither is valid)"""
+    created = parse_timestamp(post.get('createdAt'))
+    return created if created is not None else parse_timestamp(post.get('date'))
+
+def comment_digest(comment):
+    """The parts of a comment the aggregate uses: [id, approved, content length, day, post id, timestamp]"""
+    post_id = comment.get('postId')
+    return [comment.get('id'), bool(comment.get('approved', False)),
+            content_length(comment), comment.get('date', '').split(' ')[0],
+            post_id if isinstance(post_id, (int, str)) else None, parse_timestamp(comment.get('date'))]
+
+# Restriction of the analytics sections to part of the blog: posts dated
+# start..end (inclusive) in a category and/or publication state, plus the
+# comments written start..end on such posts; None parts are not filtered
+AnalyticsFilter = namedtuple('AnalyticsFilter', ['start', 'end', 'category', 'published'])
+
+def make_filter(start=None, end=None, category=None, published=None):
+    """AnalyticsFilter from its parts (dates as date objects or 'YYYY-MM-DD'), or None when nothing is filtered"""
+    if start is None and end is None and category is None and published is None:
+        return None
+    
+    bounds = []
+    for bound in (start, end):
+        if isinstance(bound, str):
+            bound = date.fromisoformat(bound)
+        elif isinstance(bound, datetime):
+            bound = bound.date()
+        bounds.append(bound)
+    return AnalyticsFilter(bounds[0], bounds[1], category, None if published is None else bool(published))
+
+def iter_chunks(items, size):
+    """Split an iterable into lists of at most size items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# Export file formats, their file suffix and default compression
+EXPORT_FORMATS = {'csv': ('.csv', None), 'parquet': ('.parquet', 'zstd'), 'feather': ('.feather', 'lz4')}
+EXPORT_CHUNK_SIZE = 10000
+
+def export_columns(records, columns=None):
+    """Columns of the records in first-seen order (like a DataFrame), optionally projected onto columns"""
+    seen = {}
+    for record in records:
+        for key in record:
+            if key not in seen:
+                seen[key] = None
+    if columns is None:
+        return list(seen)
+    return [column for column in columns if column in seen]
+
+def export_schema(records, columns):
+    """Arrow schema inferred from the non-null values of every column"""
+    import pyarrow as pa
+    
+    kinds = {column: set() for column in columns}
+    for record in records:
+        for column in columns:
+            value = record.get(column)
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                kinds[column].add('list' if all(isinstance(item, str) for item in value) else 'json')
+            elif isinstance(value, bool):
+                kinds[column].add('bool')
+            elif isinstance(value, int):
+                kinds[column].add('int')
+            elif isinstance(value, float):
+                kinds[column].add('float')
+            elif isinstance(value, str):
+                kinds[column].add('str')
+            else:
+                kinds[column].add('json')
+    
+    fields = []
+    for column in columns:
+        found = kinds[column]
+        if found == {'bool'}:
+            field_type = pa.bool_()
+        elif found == {'int'}:
+            field_type = pa.int64()
+        elif found and found <= {'int', 'float'}:
+            field_type = pa.float64()
+        elif found == {'list'}:
+            field_type = pa.list_(pa.string())
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(column, field_type))
+    return pa.schema(fields)
+
+def export_value(value, field_type):
+    """Convert a record value to what the Arrow column of field_type holds"""
+    import pyarrow as pa
+    
+    if value is None or not pa.types.is_string(field_type) or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value)
+    return str(value)
+
+def write_export(records, file_path, file_format='csv', columns=None,
+                 chunk_size=EXPORT_CHUNK_SIZE, compression=None):
+    """Stream records to a CSV, Parquet or Feather file chunk_size rows at a time; returns the row count"""
+    rows = 0
+    if file_format == 'csv':
+        import csv
+        import gzip
+        
+        opener = gzip.open if compression == 'gzip' else open
+        with opener(file_path, 'wt', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(columns)
+            for chunk in iter_chunks(records, chunk_size):
+                writer.writerows([record.get(column) for column in columns] for record in chunk)
+                rows += len(chunk)
+        return rows
+    
+    import pyarrow as pa
+    
+    schema = export_schema(records, columns)
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(file_path, schema, compression=compression or 'none')
+    else:
+        import pyarrow.ipc as ipc
+        options = ipc.IpcWriteOptions(compression=compression)
+        writer = ipc.new_file(str(file_path), schema, options=options)
+    
+    with writer:
+        for chunk in iter_chunks(records, chunk_size):
+            arrays = [pa.array([export_value(record.get(field.name), field.type) for record in chunk], type=field.type)
+                      for field in schema]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            rows += len(chunk)
+    return rows
+
+def top_content_rows(top_by_views, top_by_comments, top_by_likes, top_by_engagement):
+    """Format the selected posts of each top content list"""
+    return {
+        'top_by_views': [
+            {
+                'title': post.get('title', ''),
+                'views': post.get('views', 0),
+                'date': post.get('date', ''),
+                'category': post.get('category', '')
+            }
+            for post in top_by_views
+        ],
+        'top_by_comments': [
+            {
+                'title': post.get('title', ''),
+                'comments': post.get('comments', 0),
+                'approved_comments': post.get('approved_comments', 0),
+                'date': post.get('date', ''),
+                'category': post.get('category', '')
+            }
+            for post in top_by_comments
+        ],
+        'top_by_likes': [
+            {
+                'title': post.get('title', ''),
+                'likes': post.get('likes', 0),
+                'date': post.get('date', ''),
+                'category': post.get('category', '')
+            }
+            for post in top_by_likes
+        ],
+        'top_by_engagement': [
+            {
+                'title': post.get('title', ''),
+                'engagement_score': post.get('engagement_score', 0),
+                'views': post.get('views', 0),
+                'comments': post.get('comments', 0),
+                'likes': post.get('likes', 0),
+                'date': post.get('date', ''),
+                'category': post.get('category', '')
+            }
+            for post in top_by_engagement
+        ]
+    }
+
+class QuantileSketch:
+    """Mergeable quantile sketch (KLL-style compactors).
+    
+    Count, total, min and max are tracked exactly. Values are kept as-is
+    until a level outgrows its capacity; compaction then keeps every other
+    sorted value at twice the weight, bounding the sketch to O(k) values with
+    a rank error of roughly 1.7 / k. The worst rank error measured over
+    random-order streams of up to a million values stays below 3.5 / k, so
+    sketches sized by k_for_error() use ERROR_BOUND / k as their bound.
+    """
+    
+    ERROR_BOUND = 5
+    
+    def __init__(self, k=200):
+        self.k = k
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.levels = [[]]
+    
+    @classmethod
+    def k_for_error(cls, error):
+        """Sketch size whose rank error stays below error (0.01 = one percentile)"""
+        return max(8, int(math.ceil(cls.ERROR_BOUND / error)))
+    
+    @classmethod
+    def error_bound(cls, k):
+        """Rank error bound of a sketch of size k"""
+        return cls.ERROR_BOUND / k
+    
+    @classmethod
+    def from_values(cls, values, k=200, total=None):
+        """Exact (not yet compacted) sketch over a sequence of values"""
+        sketch = cls(k)
+        if len(values):
+            sketch.levels = [values]
+            sketch.count = len(values)
+            sketch.total = total if total is not None else math.fsum(values)
+            sketch.min = min(values)
+            sketch.max = max(values)
+        return sketch
+    
+    def add(self, value):
+        """Add a single value"""
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+        self.levels[0].append(value)
+        if len(self.levels[0]) >= self._capacity(0):
+            self.compact()
+    
+    def extend(self, values):
+        """Add an iterable of values, a level's free capacity at a time.
+        
+        Compacts at the same counts as add(), so the result is the same; only
+        O(k) of the values are held at once.
+        """
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, max(1, self._capacity(0) - len(self.levels[0]))))
+            if not chunk:
+                return self
+            self.count += len(chunk)
+            self.total += sum(chunk)
+            low, high = min(chunk), max(chunk)
+            self.min = low if self.min is None or low < self.min else self.min
+            self.max = high if self.max is None or high > self.max else self.max
+            self.levels[0].extend(chunk)
+            if len(self.levels[0]) >= self._capacity(0):
+                self.compact()
+    
+    def _capacity(self, level):
+        return max(2, int(math.ceil(self.k * (2 / 3) ** (len(self.levels) - level - 1))))
+    
+    @staticmethod
+    def _coin(seed):
+        """Unbiased bit of a seed (splitmix64 finalizer); a plain multiplicative hash repeats with the count"""
+        x = (seed + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        return (x ^ (x >> 31)) & 1
+    
+    def compact(self):
+        """Halve every level that outgrew its capacity into the next one"""
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                items = sorted(self.levels[level])
+                keep = [items.pop()] if len(items) % 2 else []
+                # Pseudo-random offset hashed from the count, so a reloaded sketch compacts like the original
+                offset = self._coin(self.count * 64 + level)
+                self.levels[level + 1].extend(items[offset::2])
+                self.levels[level] = keep
+            level += 1
+    
+    def merge(self, other):
+        """Fold another sketch into this one.
+        
+        Merging does not compact, so it loses nothing beyond what each side
+        already dropped; to_dict() compacts before the result is written.
+        """
+        if not other.count:
+            return self
+        
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append([])
+            self.levels[level] = list(self.levels[level]) + list(items)
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+    
+    def mean(self):
+        return self.total / self.count if self.count else 0
+    
+    def quantile(self, q):
+        """Value at quantile q (0..1); exact while the sketch is not compacted"""
+        return self.quantiles((q,))[0]
+    
+    def quantiles(self, qs):
+        """Values at several quantiles, sorting the sketch only once"""
+        if not self.count:
+            return [0] * len(qs)
+        
+        if len(self.levels) == 1:
+            # Exact: linear interpolation between the closest ranks
+            values = sorted(self.levels[0])
+            results = []
+            for q in qs:
+                position = q * (len(values) - 1)
+                low = int(math.floor(position))
+                high = min(low + 1, len(values) - 1)
+                fraction = position - low
+                if not fraction:
+                    results.append(values[low])
+                else:
+                    results.append((1 - fraction) * values[low] + fraction * values[high])
+            return results
+        
+        weighted = sorted((value, 1 << level) for level, items in enumerate(self.levels) for value in items)
+        cumulative = []
+        running = 0
+        for _, weight in weighted:
+            running += weight
+            cumulative.append(running)
+        last = len(weighted) - 1
+        return [weighted[min(bisect_left(cumulative, q * running), last)][0] for q in qs]
+    
+    def to_dict(self, compact=True):
+        """Serializable form, compacted down to the sketch size unless compact=False"""
+        sketch = QuantileSketch(self.k).merge(self)
+        if compact:
+            sketch.compact()
+        return {
+            'k': self.k,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'levels': sketch.levels
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['k'])
+        sketch.count = data['count']
+        sketch.total = data['total']
+        sketch.min = data['min']
+        sketch.max = data['max']
+        sketch.levels = [list(items) for items in data['levels']] or [[]]
+        return sketch
+
+def check_list_size(k, name='k'):
+    """Return k (None for the default), raising ValueError when it is below 1"""
+    if k is not None and k < 1:
+        raise ValueError(f"{name} must be at least 1, got {k}")
+    return k
+
+def merge_counts(target, source):
+    """Add the counts of source into target, keeping first-appearance order"""
+    for key, value in source.items():
+        target[key] = target.get(key, 0) + value
+    return target
+
+class AnalyticsPartial:
+    """Reduced, mergeable form of the analytics aggregate.
+    
+    Holds only totals, ordered counters, quantile sketches and bounded top-N
+    lists, so the partials of several shards can be serialized (to_dict),
+    combined (merge) and finalized into the same sections a single aggregate
+    over all the data would produce. Merging keeps the shards' order, as if
+    their data files had been concatenated.
+    """
+    
+    VERSION = 4
+    
+    # Sort key of each bounded top-N list (the top content lists and the most engaging posts)
+    TOP_KEYS = {
+        'views': lambda p: p.get('views', 0),
+        'comments': lambda p: p.get('comments', 0),
+        'likes': lambda p: p.get('likes', 0),
+        'engagement_score': lambda p: p.get('engagement_score', 0),
+        'interactions': lambda p: p.get('comments', 0) + p.get('likes', 0)
+    }
+    
+    def __init__(self, top_k=None, engaging_k=None):
+        # Length of the top content lists and of the most engaging posts list
+        # (None until known: an empty partial adopts the k of what it merges)
+        self.top_k = top_k
+        self.engaging_k = engaging_k
+        
+        # Overview
+        self.total_posts = 0
+        self.published_posts = 0
+        self.total_views = 0
+        self.total_likes = 0
+        self.approved_comments = 0
+        
+        # Content
+        self.word_counts = QuantileSketch()
+        self.reading_times = QuantileSketch()
+        self.title_lengths = QuantileSketch()
+        self.tag_frequency = Counter()
+        
+        # Engagement
+        self.engagement_rates = QuantileSketch()
+        self.comment_lengths = QuantileSketch()
+        self.comments_per_day = {}
+        self.comments_by_hour = {}
+        
+        # Comments joined to their posts: posts with approved comments, approved
+        # comments on none of the posts, hours to each post's first approved comment
+        self.commented_posts = 0
+        self.unjoined_comments = 0
+        self.response_hours = QuantileSketch()
+        
+        # Category: name -> [posts, views, comments, likes, approved comments,
+        # their length total, posts with a first response time, response seconds total]
+        self.categories = {}
+        
+        # Temporal
+        self.posts_by_month = {}
+        self.views_by_month = {}
+        self.posts_by_weekday = {}
+        self.posts_by_week = {}
+        
+        # SEO
+        self.meta_desc_lengths = QuantileSketch()
+        self.optimal_titles = 0
+        self.optimal_meta_desc = 0
+        self.posts_with_images = 0
+        self.posts_with_tags = 0
+        
+        # Top content: slim post rows per list, best first
+        self.top = {name: [] for name in self.TOP_KEYS}
+    
+    SKETCHES = ('word_counts', 'reading_times', 'title_lengths', 'engagement_rates',
+                'comment_lengths', 'response_hours', 'meta_desc_lengths')
+    TOTALS = ('total_posts', 'published_posts', 'total_views', 'total_likes', 'approved_comments',
+              'commented_posts', 'unjoined_comments', 'optimal_titles', 'optimal_meta_desc',
+              'posts_with_images', 'posts_with_tags')
+    COUNTERS = ('comments_per_day', 'comments_by_hour', 'posts_by_month', 'views_by_month', 'posts_by_weekday',
+                'posts_by_week')
+    
+    def merge(self, other):
+        """Fold another partial into this one (other's data comes after ours)"""
+        for name in self.TOTALS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in self.SKETCHES:
+            getattr(self, name).merge(getattr(other, name))
+        for name in self.COUNTERS:
+            merge_counts(getattr(self, name), getattr(other, name))
+        merge_counts(self.tag_frequency, other.tag_frequency)
+        
+        for category, totals in other.categories.items():
+            current = self.categories.setdefault(category, [0] * 8)
+            for i, value in enumerate(totals):
+                current[i] += value
+        
+        # The top N of the union is within the union of the top Ns; nlargest is
+        # stable, so ties still go to the earlier shard
+        self.top_k = self._merge_k(self.top_k, other.top_k)
+        self.engaging_k = self._merge_k(self.engaging_k, other.engaging_k)
+        for name, key in self.TOP_KEYS.items():
+            k = self.engaging_k if name == 'interactions' else self.top_k
+            rows = self.top[name] + other.top[name]
+            self.top[name] = heapq.nlargest(len(rows) if k is None else k, rows, key=key)
+        return self
+    
+    @staticmethod
+    def _merge_k(k, other_k):
+        """Length of a merged top-N list: only min(k) rows are right when shards used different k"""
+        if k is None:
+            return other_k
+        if other_k is None:
+            return k
+        return min(k, other_k)
+    
+    def to_dict(self):
+        """JSON-serializable form of the partial"""
+        data = {'version': self.VERSION, 'top_k': self.top_k, 'engaging_k': self.engaging_k}
+        for name in self.TOTALS:
+            data[name] = getattr(self, name)
+        for name in self.SKETCHES:
+            data[name] = getattr(self, name).to_dict()
+        for name in self.COUNTERS:
+            data[name] = list(getattr(self, name).items())
+        data['tag_frequency'] = list(self.tag_frequency.items())
+        data['categories'] = list(self.categories.items())
+        data['top'] = self.top
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != cls.VERSION:
+            raise ValueError(f"Unsupported partial version: {data.get('version')}")
+        
+        partial = cls(data['top_k'], data['engaging_k'])
+        for name in cls.TOTALS:
+            setattr(partial, name, data[name])
+        for name in cls.SKETCHES:
+            setattr(partial, name, QuantileSketch.from_dict(data[name]))
+        for name in cls.COUNTERS:
+            setattr(partial, name, dict(data[name]))
+        partial.tag_frequency = Counter(dict(data['tag_frequency']))
+        partial.categories = {category: list(totals) for category, totals in data['categories']}
+        partial.top = {name: list(data['top'].get(name, [])) for name in cls.TOP_KEYS}
+        return partial
+    
+    def overview(self):
+        """Finalize the blog overview section"""
+        if not self.total_posts:
+            return {
+                'total_posts': 0,
+                'published_posts': 0,
+                'draft_posts': 0,
+                'total_views': 0,
+                'total_comments': 0,
+                'total_likes': 0,
+                'average_views_per_post': 0,
+                'average_comments_per_post': 0
+            }
+        
+        published_posts = self.published_posts
+        avg_views = self.total_views / published_posts if published_posts > 0 else 0
+        avg_comments = self.approved_comments / published_posts if published_posts > 0 else 0
+        
+        return {
+            'total_posts': self.total_posts,
+            'published_posts': published_posts,
+            'draft_posts': self.total_posts - published_posts,
+            'total_views': self.total_views,
+            'total_comments': self.approved_comments,
+            'total_likes': self.total_likes,
+            'average_views_per_post': round(avg_views, 2),
+            'average_comments_per_post': round(avg_comments, 2)
+        }
+    
+    PERCENTILES = (('median', 0.5), ('p90', 0.9), ('p99', 0.99))
+    
+    @classmethod
+    def percentiles(cls, sketch):
+        """Median, 90th and 99th percentile of a sketch, rounded for output"""
+        values = sketch.quantiles([q for _, q in cls.PERCENTILES])
+        return {name: round(float(value), 2) for (name, _), value in zip(cls.PERCENTILES, values)}
+    
+    def content_analysis(self):
+        """Finalize the content analysis section"""
+        if not self.total_posts:
+            return {}
+        
+        word_counts = self.word_counts
+        reading_times = self.reading_times
+        title_lengths = self.title_lengths
+        
+        return {
+            'word_count_stats': {
+                'min': word_counts.min if word_counts.count else 0,
+                'max': word_counts.max if word_counts.count else 0,
+                'average': round(word_counts.mean(), 2),
+                **self.percentiles(word_counts)
+            },
+            'reading_time_stats': {
+                'min': reading_times.min if reading_times.count else 0,
+                'max': reading_times.max if reading_times.count else 0,
+                'average': round(reading_times.mean(), 2),
+                **self.percentiles(reading_times)
+            },
+            'title_length_stats': {
+                'min': title_lengths.min if title_lengths.count else 0,
+                'max': title_lengths.max if title_lengths.count else 0,
+                'average': round(title_lengths.mean(), 2)
+            },
+            'most_used_tags': dict(self.tag_frequency.most_common(10)),
+            'total_unique_tags': len(self.tag_frequency)
+        }
+    
+    def engagement_analysis(self, k=None):
+        """Finalize the engagement analysis section (k most engaging posts, at most engaging_k)"""
+        check_list_size(k)
+        if not self.total_posts:
+            return {}
+        
+        engagement_rates = self.engagement_rates
+        comment_lengths = self.comment_lengths
+        response_hours = self.response_hours
+        rate_percentiles = self.percentiles(engagement_rates)
+        
+        return {
+            'engagement_rate_stats': {
+                'average': round(engagement_rates.mean(), 2),
+                'median': rate_percentiles['median'],
+                'max': round(engagement_rates.max, 2) if engagement_rates.count else 0,
+                'p90': rate_percentiles['p90'],
+                'p99': rate_percentiles['p99']
+            },
+            'comment_stats': {
+                'total_comments': comment_lengths.count,
+                'average_length': round(comment_lengths.mean(), 2),
+                'length_percentiles': self.percentiles(comment_lengths),
+                'comments_per_day': dict(self.comments_per_day),
+                'comments_by_hour': {f'{hour:02d}': self.comments_by_hour.get(hour, 0) for hour in range(24)},
+                'posts_with_comments': self.commented_posts,
+                'unjoined_comments': self.unjoined_comments,
+                'first_response_hours': {
+                    'average': round(response_hours.mean(), 2),
+                    **self.percentiles(response_hours)
+                }
+            },
+            'most_engaging_posts': [
+                {
+                    'title': post.get('title', ''),
+                    'views': post.get('views', 0),
+                    'comments': post.get('comments', 0),
+                    'approved_comments': post.get('approved_comments', 0),
+                    'likes': post.get('likes', 0)
+                }
+                for post in self.top['interactions'][:k]
+            ]
+        }
+    
+    def category_performance(self):
+        """Finalize the per-category performance section"""
+        result = {}
+        for category, totals in self.categories.items():
+            posts, views, comments, likes, approved, length, responded, response_seconds = totals
+            stats = {
+                'posts': posts,
+                'total_views': views,
+                'total_comments': comments,
+                'total_likes': likes,
+                'average_views': 0,
+                'average_comments': 0,
+                'average_likes': 0,
+                'approved_comments': approved,
+                'average_comment_length': round(length / approved, 2) if approved else 0,
+                'average_first_response_hours': round(response_seconds / responded / 3600, 2) if responded else None
+            }
+            if posts > 0:
+                stats['average_views'] = round(views / posts, 2)
+                stats['average_comments'] = round(comments / posts, 2)
+                stats['average_likes'] = round(likes / posts, 2)
+            result[category] = stats
+        
+        return result
+    
+    def temporal_analysis(self):
+        """Finalize the temporal analysis section"""
+        if not self.total_posts:
+            return {}
+        
+        posts_by_month = self.posts_by_month
+        posts_by_weekday = self.posts_by_weekday
+        
+        # Publishing frequency
+        if posts_by_month:
+            months = sorted(posts_by_month.keys())
+            if len(months) > 1:
+                start_date = datetime.strptime(months[0], '%Y-%m')
+                end_date = datetime.strptime(months[-1], '%Y-%m')
+                months_diff = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+                avg_posts_per_month = self.total_posts / months_diff
+            else:
+                avg_posts_per_month = self.total_posts
+        else:
+            avg_posts_per_month = 0
+        
+        return {
+            'posts_by_month': dict(posts_by_month),
+            'views_by_month': dict(self.views_by_month),
+            'posts_by_weekday': dict(posts_by_weekday),
+            'posts_by_week': dict(self.posts_by_week),
+            'average_posts_per_month': round(avg_posts_per_month, 2),
+            'most_productive_month': max(posts_by_month.items(), key=lambda x: x[1])[0] if posts_by_month else None,
+            'most_productive_weekday': max(posts_by_weekday.items(), key=lambda x: x[1])[0] if posts_by_weekday else None,
+            'most_productive_week': max(self.posts_by_week.items(), key=lambda x: x[1])[0] if self.posts_by_week else None
+        }
+    
+    def top_performing_content(self, k=None):
+        """Finalize the top performing content section (k posts per list, at most top_k)"""
+        check_list_size(k)
+        if not self.total_posts:
+            return {}
+        
+        return top_content_rows(self.top['views'][:k], self.top['comments'][:k],
+                                self.top['likes'][:k], self.top['engagement_score'][:k])
+    
+    def seo_analysis(self):
+        """Finalize the SEO analysis section"""
+        if not self.total_posts:
+            return {}
+        
+        total_posts = self.total_posts
+        
+        return {
+            'title_analysis': {
+                'average_length': round(self.title_lengths.total / total_posts, 2),
+                'optimal_length_count': self.optimal_titles,
+                'optimal_percentage': round((self.optimal_titles / total_posts) * 100, 2)
+            },
+            'meta_description_analysis': {
+                'average_length': round(self.meta_desc_lengths.total / total_posts, 2),
+                'optimal_length_count': self.optimal_meta_desc,
+                'optimal_percentage': round((self.optimal_meta_desc / total_posts) * 100, 2)
+            },
+            'content_optimization': {
+                'posts_with_images': self.posts_with_images,
+                'posts_with_images_percentage': round((self.posts_with_images / total_posts) * 100, 2),
+                'posts_with_tags': self.posts_with_tags,
+                'posts_with_tags_percentage': round((self.posts_with_tags / total_posts) * 100, 2)
+            }
+        }
+
+def rotate_tick_labels(ax):
+    """Rotate the x tick labels by 45 degrees, anchored on their right end"""
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_ha('right')
+
+def draw_overview_panel(ax, data):
+    metrics = ['Posts', 'Views', 'Comments', 'Likes']
+    values = data['values']
+    
+    bars = ax.bar(metrics, values, color=['#3498db', '#e74c3c', '#2ecc71', '#f39c12'])
+    ax.set_title('Blog Overview', fontweight='bold')
+    ax.set_ylabel('Count')
+    
+    # Add value labels on bars
+    for bar, value in zip(bars, values):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
+                f'{value}', ha='center', va='bottom')
+
+def draw_category_panel(ax, data):
+    if data['categories']:
+        ax.bar(data['categories'], data['average_views'], color='#9b59b6')
+        ax.set_title('Average Views by Category', fontweight='bold')
+        ax.set_ylabel('Average Views')
+        rotate_tick_labels(ax)
+
+def draw_engaging_posts_panel(ax, data):
+    if data['titles']:
+        ax.barh(data['titles'], data['scores'], color='#1abc9c')
+        ax.set_title('Most Engaging Posts', fontweight='bold')
+        ax.set_xlabel('Comments + Likes')
+
+def draw_publishing_timeline_panel(ax, data):
+    if data['months']:
+        ax.plot(data['months'], data['counts'], marker='o', linestyle='-', color='#e67e22')
+        ax.set_title('Publishing Timeline', fontweight='bold')
+        ax.set_ylabel('Posts Published')
+        rotate_tick_labels(ax)
+
+def draw_word_count_panel(ax, data):
+    if data['word_counts']:
+        ax.hist(data['word_counts'], bins=10, color='#34495e', alpha=0.7)
+        ax.set_title('Word Count Distribution', fontweight='bold')
+        ax.set_xlabel('Word Count')
+        ax.set_ylabel('Number of Posts')
+
+def draw_tag_panel(ax, data):
+    if data['tags']:
+        ax.bar(data['tags'], data['counts'], color='#8e44ad')
+        ax.set_title('Most Popular Tags', fontweight='bold')
+        ax.set_ylabel('Usage Count')
+        rotate_tick_labels(ax)
+
+def draw_views_engagement_panel(ax, data):
+    if data['views'] and data['engagement']:
+        ax.scatter(data['views'], data['engagement'], alpha=0.6, color='#e74c3c')
+        ax.set_title('Views vs Engagement', fontweight='bold')
+        ax.set_xlabel('Views')
+        ax.set_ylabel('Comments + Likes')
+
+def draw_seo_panel(ax, data):
+    seo_metrics = ['Optimal Titles', 'Posts with Images', 'Posts with Tags']
+    seo_percentages = data['percentages']
+    
+    colors = ['#27ae60' if p >= 80 else '#f39c12' if p >= 50 else '#e74c3c' for p in seo_percentages]
+    bars = ax.bar(seo_metrics, seo_percentages, color=colors)
+    ax.set_title('SEO Optimization Status', fontweight='bold')
+    ax.set_ylabel('Percentage (%)')
+    ax.set_ylim(0, 100)
+    rotate_tick_labels(ax)
+    
+    # Add percentage labels
+    for bar, percentage in zip(bars, seo_percentages):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
+                f'{percentage:.1f}%', ha='center', va='bottom')
+
+def draw_comments_timeline_panel(ax, data):
+    if data['dates']:
+        ax.plot(data['dates'], data['counts'], marker='o', linestyle='-', color='#2ecc71')
+        ax.set_title('Comments Timeline (Last 30 Days)', fontweight='bold')
+        ax.set_ylabel('Comments')
+        rotate_tick_labels(ax)
+
+def draw_weekday_panel(ax, data):
+    if data['counts']:
+        ax.bar(WEEKDAY_NAMES, data['counts'], color='#f39c12')
+        ax.set_title('Posts by Day of Week', fontweight='bold')
+        ax.set_ylabel('Number of Posts')
+        rotate_tick_labels(ax)
+
+def draw_heatmap_panel(ax, data):
+    if data['matrix']:
+        im = ax.imshow(data['matrix'], cmap='YlOrRd', aspect='auto')
+        ax.set_xticks(range(len(data['metrics'])))
+        ax.set_xticklabels(data['metrics'])
+        ax.set_yticks(range(len(data['categories'])))
+        ax.set_yticklabels(data['categories'])
+        ax.set_title('Category Performance Heatmap', fontweight='bold')
+        
+        # Add colorbar
+        ax.figure.colorbar(im, ax=ax, shrink=0.8)
+
+# Dashboard panels in drawing order: name, renderer and (row, column, columns spanned) on a 3x4 grid
+DASHBOARD_PANELS = [
+    ('overview', draw_overview_panel, (0, 0, 1)),
+    ('categories', draw_category_panel, (0, 1, 1)),
+    ('engaging_posts', draw_engaging_posts_panel, (0, 2, 1)),
+    ('publishing_timeline', draw_publishing_timeline_panel, (0, 3, 1)),
+    ('word_counts', draw_word_count_panel, (1, 0, 1)),
+    ('tags', draw_tag_panel, (1, 1, 1)),
+    ('views_engagement', draw_views_engagement_panel, (1, 2, 1)),
+    ('seo', draw_seo_panel, (1, 3, 1)),
+    ('comments_timeline', draw_comments_timeline_panel, (2, 0, 1)),
+    ('weekdays', draw_weekday_panel, (2, 1, 1)),
+    ('heatmap', draw_heatmap_panel, (2, 2, 2))
+]
+DASHBOARD_GRID = (3, 4)
+DASHBOARD_CELL_INCHES = 5
+IMAGE_FORMATS = ('png', 'svg', 'webp')
+
+def render_panel_image(index, data, dpi):
+    """Worker: render one dashboard panel on the Agg backend into an RGBA array of its grid cell"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
+    _, draw, (_, _, span) = DASHBOARD_PANELS[index]
+    fig = plt.figure(figsize=(DASHBOARD_CELL_INCHES * span, DASHBOARD_CELL_INCHES), dpi=dpi)
+    draw(fig.add_subplot(1, 1, 1), data)
+    fig.tight_layout()
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+    return image
+
+class PostColumns:
+    """Columnar copy of the posts' numeric and categorical fields.
+    
+    Filled one post at a time during the aggregation pass into compact
+    array.array buffers (a few dozen bytes per post). The overview, category,
+    SEO and top content sections reduce over these columns: with NumPy, via
+    zero-copy views of the buffers, once use_numpy() has been called, and in
+    plain Python otherwise.
+    """
+    
+    # Derived metrics as column weights, computed on demand
+    METRICS = {
+        'engagement_score': {'views': 1, 'comments': 10, 'likes': 5},
+        'interactions': {'comments': 1, 'likes': 1}
+    }
+    
+    def __init__(self):
+        self.np = None
+        
+        self.ids = array('q')
+        self.views = array('q')
+        self.likes = array('q')
+        self.comments = array('q')
+        self.published = array('B')
+        self.has_image = array('B')
+        self.has_tags = array('B')
+        self.title_lengths = array('i')
+        self.meta_desc_lengths = array('i')
+        self.word_counts = array('i')
+        self.reading_times = array('i')
+        
+        # Categories as integer codes, numbered in order of first appearance
+        self.category_codes = array('i')
+        self.category_names = []
+        self._category_index = {}
+        
+        # Publication date as a proleptic Gregorian ordinal (0 when missing or invalid)
+        self.days = array('i')
+    
+    def __len__(self):
+        return len(self.views)
+    
+    def append(self, post, day=0, post_text=None):
+        """Add one post's fields (and the word count and reading time of its text) to the columns"""
+        post_id = post.get('id', 0)
+        self.ids.append(post_id if isinstance(post_id, int) else -1)
+        self.views.append(int(post.get('views', 0)))
+        self.likes.append(int(post.get('likes', 0)))
+        self.comments.append(int(post.get('comments', 0)))
+        self.published.append(bool(post.get('published', True)))
+        self.has_image.append(bool(post.get('image')))
+        self.has_tags.append(bool(post.get('tags')))
+        self.title_lengths.append(len(post.get('title', '')))
+        self.meta_desc_lengths.append(len(post.get('metaDescription', '')))
+        self.word_counts.append(post_text.word_count if post_text is not None else 0)
+        self.reading_times.append(post_text.reading_time if post_text is not None else 0)
+        
+        category = post.get('category', 'uncategorized')
+        code = self._category_index.get(category)
+        if code is None:
+            code = self._category_index[category] = len(self.category_names)
+            self.category_names.append(category)
+        self.category_codes.append(code)
+        self.days.append(day)
+    
+    def set_counts(self, index, post):
+        """Overwrite the view, like and comment counts of the post at index"""
+        self.views[index] = int(post.get('views', 0))
+        self.likes[index] = int(post.get('likes', 0))
+        self.comments[index] = int(post.get('comments', 0))
+    
+    def to_dict(self):
+        """JSON-serializable form of the columns"""
+        data = {name: buffer.tolist() for name, buffer in vars(self).items() if isinstance(buffer, array)}
+        data['category_names'] = self.category_names
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        columns = cls()
+        for name, buffer in list(vars(columns).items()):
+            if isinstance(buffer, array):
+                setattr(columns, name, array(buffer.typecode, data[name]))
+        columns.category_names = list(data['category_names'])
+        columns._category_index = {name: code for code, name in enumerate(columns.category_names)}
+        return columns
+    
+    def use_numpy(self):
+        """Switch the reductions to NumPy (raises ImportError when it is missing)"""
+        import numpy
+        self.np = numpy
+    
+    def column(self, name):
+        """A column as a NumPy array (zero-copy view of the buffer)"""
+        buffer = getattr(self, name)
+        return self.np.frombuffer(buffer, dtype=buffer.typecode) if len(buffer) else self.np.zeros(0, buffer.typecode)
+    
+    def dates(self):
+        """Publication dates as a datetime64[D] array (NaT when missing or invalid)"""
+        np = self.np
+        days = self.column('days').astype(np.int64)
+        dates = (days - UNIX_EPOCH_DAY).astype('datetime64[D]')
+        dates[days == 0] = np.datetime64('NaT')
+        return dates
+    
+    def weights(self, metric):
+        """Column weights of a metric: a column name, a derived metric name or a weight mapping"""
+        if isinstance(metric, dict):
+            return metric
+        return self.METRICS.get(metric, {metric: 1})
+    
+    def metric_values(self, metric):
+        """Values of a metric for every post (a side array; nothing is stored on the posts)"""
+        weights = self.weights(metric)
+        if self.np is None:
+            if len(weights) == 1:
+                (name, weight), = weights.items()
+                column = getattr(self, name)
+                return column if weight == 1 else [value * weight for value in column]
+            columns = [getattr(self, name) for name in weights]
+            factors = list(weights.values())
+            return [sum(value * factor for value, factor in zip(row, factors)) for row in zip(*columns)]
+        
+        values = None
+        for name, weight in weights.items():
+            term = self.column(name).astype(self.np.int64) * weight
+            values = term if values is None else values + term
+        return values
+    
+    def metric_value(self, metric, index):
+        """Value of a metric for the post at index"""
+        return sum(getattr(self, name)[index] * weight for name, weight in self.weights(metric).items())
+    
+    def top_indices(self, metric, k):
+        """Indices of the k largest values of a metric in O(n log k), ties broken by position like heapq.nlargest"""
+        if k <= 0:
+            return []
+        values = self.metric_values(metric)
+        if self.np is None:
+            return heapq.nlargest(k, range(len(values)), key=values.__getitem__)
+        
+        np = self.np
+        if len(values) > k:
+            threshold = np.partition(values, len(values) - k)[len(values) - k]
+            greater = np.flatnonzero(values > threshold)
+            equal = np.flatnonzero(values == threshold)[:k - len(greater)]
+            candidates = np.concatenate([greater, equal])
+        else:
+            candidates = np.arange(len(values))
+        order = np.lexsort((candidates, -values[candidates]))
+        return [int(i) for i in candidates[order]]
+    
+    def day_totals(self):
+        """(day, posts, views) of every publication day, in order of first appearance"""
+        if self.np is None:
+            totals = {}
+            for day, views in zip(self.days, self.views):
+                if day:
+                    entry = totals.get(day)
+                    if entry is None:
+                        totals[day] = [1, views]
+                    else:
+                        entry[0] += 1
+                        entry[1] += views
+            return [(day, posts, views) for day, (posts, views) in totals.items()]
+        
+        # Grouped on the datetime64 date column
+        np = self.np
+        dates = self.dates()
+        dated = np.flatnonzero(~np.isnat(dates))
+        unique, first, inverse = np.unique(dates[dated], return_index=True, return_inverse=True)
+        posts = np.bincount(inverse, minlength=len(unique))
+        views = np.bincount(inverse, weights=self.column('views')[dated], minlength=len(unique))
+        days = unique.astype(np.int64) + UNIX_EPOCH_DAY
+        return [(int(days[i]), int(posts[i]), int(views[i])) for i in np.argsort(first, kind='stable')]
+    
+    def engagement_rates(self):
+        """(comments + likes) / views in percent, for every post with views (a generator without NumPy)"""
+        if self.np is None:
+            return (((comments + likes) / views) * 100
+                    for views, comments, likes in zip(self.views, self.comments, self.likes) if views > 0)
+        
+        views = self.column('views')
+        viewed = views > 0
+        return (((self.column('comments')[viewed] + self.column('likes')[viewed]) / views[viewed]) * 100).tolist()
+    
+    def total(self, name):
+        """Sum of a column"""
+        if self.np is None:
+            return sum(getattr(self, name))
+        return int(self.column(name).sum(dtype=self.np.int64))
+    
+    def count_between(self, name, low, high):
+        """Number of values of a column within [low, high]"""
+        if self.np is None:
+            return sum(1 for value in getattr(self, name) if low <= value <= high)
+        values = self.column(name)
+        return int(((values >= low) & (values <= high)).sum())
+    
+    def category_totals(self):
+        """Per-category post count and view/comment/like totals, in category order"""
+        size = len(self.category_names)
+        if self.np is None:
+            totals = [[0, 0, 0, 0] for _ in range(size)]
+            for code, views, comments, likes in zip(self.category_codes, self.views, self.comments, self.likes):
+                row = totals[code]
+                row[0] += 1
+                row[1] += views
+                row[2] += comments
+                row[3] += likes
+            return totals
+        
+        np = self.np
+        codes = self.column('category_codes')
+        posts = np.bincount(codes, minlength=size)
+        sums = [np.bincount(codes, weights=self.column(name), minlength=size)
+                for name in ('views', 'comments', 'likes')]
+        return [[int(posts[code])] + [int(column[code]) for column in sums] for code in range(size)]
+
+class CommentIndex:
+    """Comments joined to their posts, keyed by postId and built in one pass over the comments.
+    
+    Holds [approved, pending, approved length total, first approved comment
+    timestamp] per post id, so the comment statistics of a post are an O(1)
+    lookup. Comments without a usable postId are only counted.
+    """
+    
+    def __init__(self):
+        self.posts = {}
+        self.unattached = 0
+    
+    def add(self, digest):
+        """Fold in a comment given as its comment_digest()"""
+        _, approved, length, _, post_id, timestamp = digest
+        if post_id is None:
+            self.unattached += 1
+            return
+        
+        entry = self.posts.get(post_id)
+        if entry is None:
+            entry = self.posts[post_id] = [0, 0, 0, None]
+        if approved:
+            entry[0] += 1
+            entry[2] += length
+            if timestamp is not None and (entry[3] is None or timestamp < entry[3]):
+                entry[3] = timestamp
+        else:
+            entry[1] += 1
+    
+    def approved(self, post_id):
+        """Approved comments on a post"""
+        entry = self.posts.get(post_id)
+        return entry[0] if entry is not None else 0
+    
+    @staticmethod
+    def response_seconds(first_comment, created):
+        """Seconds from a post going online to its first approved comment (None when either is unknown)"""
+        if first_comment is None or created is None:
+            return None
+        return max(0, first_comment - created)
+    
+    def post_stats(self, post_id, created=None):
+        """Comment statistics of one post (created: its post_created() timestamp)"""
+        approved, pending, length, first_comment = self.posts.get(post_id, (0, 0, 0, None))
+        response = self.response_seconds(first_comment, created)
+        return comment_stats(approved, pending, length, first_comment,
+                             None if response is None else response / 3600)
+    
+    def to_dict(self):
+        return {'posts': list(self.posts.items()), 'unattached': self.unattached}
+    
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        index.posts = {post_id: list(entry) for post_id, entry in data['posts']}
+        index.unattached = data['unattached']
+        return index
+
+def comment_stats(approved, pending, length, first_comment, response_hours):
+    """Per-post comment statistics, as returned by get_post_comment_stats"""
+    return {
+        'approved_comments': approved,
+        'pending_comments': pending,
+        'average_comment_length': round(length / approved, 2) if approved else 0,
+        'first_comment_at': (datetime(1970, 1, 1) + timedelta(seconds=first_comment)).isoformat(' ')
+                            if first_comment is not None else None,
+        'first_response_hours': round(response_hours, 2) if response_hours is not None else None
+    }
+
+class AnalyticsAggregate:
+    """Accumulators for every analytics section, filled in a single pass.
+    
+    Each post and comment is visited exactly once through add_post() and
+    add_comment(); the section methods only finalize the accumulators.
+    """
+    
+    def __init__(self, text_cache=None, top_k=10, engaging_k=5, sketch_k=200):
+        # Cleaned text, word counts and reading times shared with the other text consumers
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        self.sketch_k = sketch_k
+        
+        # Per-post numeric and categorical fields (overview, category, SEO, top content)
+        self.columns = PostColumns()
+        self.approved_comments = 0
+        
+        # Content (word counts and reading times are also kept per post in the
+        # columns, for filtered subsets and incremental rebuilds)
+        self.word_counts = QuantileSketch(sketch_k)
+        self.reading_times = QuantileSketch(sketch_k)
+        self.tag_frequency = Counter()
+        
+        # Engagement (rates come from the columns; comment lengths are
+        # streamed into a sketch, so they take O(sketch_k) memory)
+        self.comment_lengths = QuantileSketch(sketch_k)
+        self.comments_per_day = defaultdict(int)
+        
+        # Comments per post id, joined to the posts when the sections are finalized
+        self.comment_index = CommentIndex()
+        
+        # Approved comments per hour of the day they were written
+        self.comments_by_hour = [0] * 24
+        
+        # Temporal buckets (month, weekday, ISO week) are rolled up from the
+        # publication days in the columns when the sections are finalized
+        
+        # Top content (slim copies of the posts, without their bodies)
+        self.posts = []
+        self.top_k = top_k
+        self.engaging_k = engaging_k
+        
+        # Reduced form of the accumulators, built on demand by to_partial()
+        self._partial = None
+        
+        # First position of each post id, built on demand by post_comment_stats()
+        self._positions = None
+    
+    @property
+    def total_posts(self):
+        return len(self.columns)
+    
+    def add_post(self, post, post_text=None, count_tags=True):
+        """Fold a single post into every section's accumulators.
+        
+        post_text and count_tags=False let a caller that already analyzed the
+        text (e.g. in worker processes) skip that part of the work.
+        """
+        self._partial = None
+        self._positions = None
+        
+        if post_text is None:
+            post_text = self.text_cache.get(post)
+        self.word_counts.add(post_text.word_count)
+        self.reading_times.add(post_text.reading_time)
+        if count_tags:
+            self.tag_frequency.update(post.get('tags', []))
+        
+        self.columns.append(post, post_day(post.get('date', '')), post_text)
+        self.posts.append({key: post[key] for key in POST_ROW_FIELDS if key in post})
+    
+    def add_comment(self, comment):
+        """Fold a single comment into the engagement accumulators"""
+        self.add_comment_digest(comment_digest(comment))
+    
+    def add_comment_digest(self, digest):
+        """Fold a comment given as its comment_digest()"""
+        self._partial = None
+        _, approved, length, day, _, timestamp = digest
+        self.comment_index.add(digest)
+        if approved:
+            self.approved_comments += 1
+            self.comment_lengths.add(length)
+            if timestamp is not None:
+                self.comments_by_hour[timestamp // 3600 % 24] += 1
+            
+            # Group comments by date
+            if day:
+                self.comments_per_day[day] += 1
+    
+    def update_post_counts(self, index, row):
+        """Apply new view/like/comment counts of the post at index (its other fields unchanged)"""
+        self._partial = None
+        self.columns.set_counts(index, row)
+        self.posts[index] = row
+    
+    def to_dict(self):
+        """JSON-serializable form of the accumulators (see from_dict)"""
+        return {
+            'columns': self.columns.to_dict(),
+            'approved_comments': self.approved_comments,
+            'word_counts': self.word_counts.to_dict(compact=False),
+            'reading_times': self.reading_times.to_dict(compact=False),
+            'tag_frequency': list(self.tag_frequency.items()),
+            'comment_lengths': self.comment_lengths.to_dict(compact=False),
+            'comments_per_day': list(self.comments_per_day.items()),
+            'comment_index': self.comment_index.to_dict(),
+            'comments_by_hour': self.comments_by_hour,
+            'posts': self.posts
+        }
+    
+    @classmethod
+    def from_dict(cls, data, text_cache=None, top_k=10, engaging_k=5):
+        aggregate = cls(text_cache, top_k, engaging_k, data['comment_lengths']['k'])
+        aggregate.columns = PostColumns.from_dict(data['columns'])
+        aggregate.approved_comments = data['approved_comments']
+        aggregate.word_counts = QuantileSketch.from_dict(data['word_counts'])
+        aggregate.reading_times = QuantileSketch.from_dict(data['reading_times'])
+        aggregate.tag_frequency = Counter(dict(data['tag_frequency']))
+        aggregate.comment_lengths = QuantileSketch.from_dict(data['comment_lengths'])
+        aggregate.comments_per_day = defaultdict(int, data['comments_per_day'])
+        aggregate.comments_by_hour = list(data['comments_by_hour'])
+        aggregate.comment_index = CommentIndex.from_dict(data['comment_index'])
+        aggregate.posts = data['posts']
+        return aggregate
+    
+    def to_partial(self):
+        """Reduce the accumulators to a mergeable AnalyticsPartial.
+        
+        Title and meta description lengths are left uncompacted, so their local
+        sections stay exact; they are only compacted when the partial is
+        serialized. Word counts, reading times, engagement rates, comment
+        lengths and response times are streamed into sketches, so their
+        quantiles are approximate once there are more than sketch_k values.
+        """
+        if self._partial is not None:
+            return self._partial
+        
+        columns = self.columns
+        partial = AnalyticsPartial(self.top_k, self.engaging_k)
+        partial.total_posts = self.total_posts
+        partial.published_posts = columns.total('published')
+        partial.total_views = columns.total('views')
+        partial.total_likes = columns.total('likes')
+        partial.approved_comments = self.approved_comments
+        
+        sketch_k = self.sketch_k
+        partial.word_counts = QuantileSketch(sketch_k).merge(self.word_counts)
+        partial.reading_times = QuantileSketch(sketch_k).merge(self.reading_times)
+        partial.title_lengths = QuantileSketch.from_values(columns.title_lengths, sketch_k,
+                                                           total=columns.total('title_lengths'))
+        partial.tag_frequency = self.tag_frequency
+        
+        partial.engagement_rates = QuantileSketch(sketch_k).extend(columns.engagement_rates())
+        partial.comment_lengths = QuantileSketch(sketch_k).merge(self.comment_lengths)
+        partial.comments_per_day = self.comments_per_day
+        
+        partial.categories = {name: totals + [0, 0, 0, 0]
+                              for name, totals in zip(columns.category_names, columns.category_totals())}
+        self._join_comments(partial)
+        
+        partial.comments_by_hour = {hour: count for hour, count in enumerate(self.comments_by_hour) if count}
+        
+        # Calendar buckets rolled up from the per-day totals, in order of first appearance
+        for day, posts, views in columns.day_totals():
+            month, weekday, week = calendar_keys(day)
+            partial.posts_by_month[month] = partial.posts_by_month.get(month, 0) + posts
+            partial.views_by_month[month] = partial.views_by_month.get(month, 0) + views
+            partial.posts_by_weekday[weekday] = partial.posts_by_weekday.get(weekday, 0) + posts
+            partial.posts_by_week[week] = partial.posts_by_week.get(week, 0) + posts
+        
+        # Title length analysis (optimal: 50-60 characters)
+        partial.optimal_titles = columns.count_between('title_lengths', 50, 60)
+        
+        # Meta description analysis (optimal: 150-160 characters)
+        partial.meta_desc_lengths = QuantileSketch.from_values(columns.meta_desc_lengths, sketch_k,
+                                                               total=columns.total('meta_desc_lengths'))
+        partial.optimal_meta_desc = columns.count_between('meta_desc_lengths', 150, 160)
+        partial.posts_with_images = columns.total('has_image')
+        partial.posts_with_tags = columns.total('has_tags')
+        
+        for name in ('views', 'comments', 'likes', 'engagement_score'):
+            partial.top[name] = self.top_rows(name, self.top_k)
+        partial.top['interactions'] = self.top_rows('interactions', self.engaging_k)
+        
+        self._partial = partial
+        return partial
+    
+    def _join_comments(self, partial):
+        """Join the comment index to the posts: per-category comment totals and first response times.
+        
+        The comments of a post id go to the first post carrying that id.
+        """
+        index = self.comment_index.posts
+        columns = self.columns
+        categories = list(partial.categories.values())
+        response_hours = QuantileSketch(self.sketch_k)
+        joined = set()
+        commented_posts = 0
+        joined_approved = 0
+        if index:
+            for position, row in enumerate(self.posts):
+                post_id = row.get('id')
+                if not isinstance(post_id, (int, str)) or post_id in joined:
+                    continue
+                entry = index.get(post_id)
+                if entry is None:
+                    continue
+                joined.add(post_id)
+                approved, _, length, first_comment = entry
+                if not approved:
+                    continue
+                
+                totals = categories[columns.category_codes[position]]
+                totals[4] += approved
+                totals[5] += length
+                commented_posts += 1
+                joined_approved += approved
+                response = CommentIndex.response_seconds(first_comment, post_created(row))
+                if response is not None:
+                    totals[6] += 1
+                    totals[7] += response
+                    response_hours.add(response / 3600)
+        
+        partial.commented_posts = commented_posts
+        partial.unjoined_comments = self.approved_comments - joined_approved
+        partial.response_hours = response_hours
+    
+    def top_rows(self, metric, k):
+        """Rows of the k posts with the largest metric, best first.
+        
+        The engagement score and approved comment count are computed for the
+        selected rows only and set on copies, never on the posts themselves.
+        """
+        rows = []
+        for index in self.columns.top_indices(metric, k):
+            row = dict(self.posts[index])
+            row['engagement_score'] = self.columns.metric_value('engagement_score', index)
+            row['approved_comments'] = self.comment_index.approved(row.get('id'))
+            rows.append(row)
+        return rows
+    
+    def post_comment_stats(self, post_id):
+        """Comment statistics of the post with post_id (an O(1) lookup once the positions are indexed)"""
+        if self._positions is None:
+            self._positions = {}
+            for position, row in enumerate(self.posts):
+                row_id = row.get('id')
+                if isinstance(row_id, (int, str)):
+                    self._positions.setdefault(row_id, position)
+        position = self._positions.get(post_id)
+        created = post_created(self.posts[position]) if position is not None else None
+        return self.comment_index.post_stats(post_id, created)
+    
+    def subset(self, positions, digests):
+        """Aggregate of the posts at positions (in file order) and of the given comment digests.
+        
+        Built from the kept post rows and word counts, so no post body is read again.
+        """
+        aggregate = AnalyticsAggregate(self.text_cache, self.top_k, self.engaging_k, self.sketch_k)
+        columns = self.columns
+        for index in positions:
+            aggregate.add_post(self.posts[index],
+                               PostText(None, columns.word_counts[index], columns.reading_times[index]))
+        for digest in digests:
+            aggregate.add_comment_digest(digest)
+        if self.columns.np is not None:
+            aggregate.columns.use_numpy()
+        return aggregate
+    
+    def overview(self):
+        """Finalize the blog overview section"""
+        return self.to_partial().overview()
+    
+    def content_analysis(self):
+        """Finalize the content analysis section"""
+        return self.to_partial().content_analysis()
+    
+    def engagement_analysis(self, k=None):
+        """Finalize the engagement analysis section"""
+        if k is not None and k > self.engaging_k:
+            self.engaging_k = k
+            self._partial = None
+        return self.to_partial().engagement_analysis(k)
+    
+    def category_performance(self):
+        """Finalize the per-category performance section"""
+        return self.to_partial().category_performance()
+    
+    def temporal_analysis(self):
+        """Finalize the temporal analysis section"""
+        return self.to_partial().temporal_analysis()
+    
+    def top_performing_content(self, k=None):
+        """Finalize the top performing content section"""
+        if k is not None and k > self.top_k:
+            self.top_k = k
+            self._partial = None
+        return self.to_partial().top_performing_content(k)
+    
+    def seo_analysis(self):
+        """Finalize the SEO analysis section"""
+        return self.to_partial().seo_analysis()
+    
+    def dashboard_columns(self):
+        """Category names and totals, then the word counts, views and interactions of every post"""
+        columns = self.columns
+        return (list(columns.category_names), columns.category_totals(), list(columns.word_counts),
+                list(columns.views), list(columns.metric_values('interactions')))
+
+class WindowIndex:
+    """Posts and comments of an aggregate sorted by date, for the section filters.
+    
+    Built once per data version. A date-range query bisects to its slice of
+    each sorted list, so it costs time proportional to the posts and
+    comments in the window instead of to the whole history; the category
+    and published filters are then checked on that slice only.
+    """
+    
+    def __init__(self, aggregate, comments):
+        self.aggregate = aggregate
+        
+        # Positions of the dated posts, by publication day (file order within a day)
+        days = aggregate.columns.days
+        self.post_order = array('i', sorted((index for index, day in enumerate(days) if day),
+                                            key=days.__getitem__))
+        self.post_days = array('i', (days[index] for index in self.post_order))
+        
+        # First post position of each post id, for the comments' postId
+        post_positions = {}
+        for index, row in enumerate(aggregate.posts):
+            post_id = row.get('id')
+            if isinstance(post_id, (int, str)):
+                post_positions.setdefault(post_id, index)
+        
+        # Comment digests and post positions in file order, plus the validly dated ones by day
+        self.comments = []
+        self.comment_posts = array('i')
+        dated = []
+        for comment in comments:
+            digest = comment_digest(comment)
+            post_id = comment.get('postId')
+            self.comment_posts.append(post_positions.get(post_id, -1) if isinstance(post_id, (int, str)) else -1)
+            day = iso_day(digest[3])
+            if day:
+                dated.append((day, len(self.comments)))
+            self.comments.append(digest)
+        
+        dated.sort()
+        self.comment_order = array('i', [index for _, index in dated])
+        self.comment_days = array('i', [day for day, _ in dated])
+    
+    def _post_matches(self, index, filters):
+        columns = self.aggregate.columns
+        if filters.category is not None and \
+                columns.category_names[columns.category_codes[index]] != filters.category:
+            return False
+        if filters.published is not None and bool(columns.published[index]) != filters.published:
+            return False
+        return True
+    
+    def select(self, filters):
+        """Positions of the matching posts and digests of the matching comments, both in file order"""
+        if filters.start is None and filters.end is None:
+            post_positions = range(len(self.aggregate.columns))
+            comment_positions = range(len(self.comments))
+        else:
+            low = bisect_left(self.post_days, filters.start.toordinal()) if filters.start else 0
+            high = bisect_right(self.post_days, filters.end.toordinal()) if filters.end else len(self.post_days)
+            post_positions = sorted(self.post_order[low:high])
+            
+            low = bisect_left(self.comment_days, filters.start.toordinal()) if filters.start else 0
+            high = bisect_right(self.comment_days, filters.end.toordinal()) if filters.end else len(self.comment_days)
+            comment_positions = sorted(self.comment_order[low:high])
+        
+        positions = [index for index in post_positions if self._post_matches(index, filters)]
+        if filters.category is None and filters.published is None:
+            digests = [self.comments[index] for index in comment_positions]
+        else:
+            digests = [self.comments[index] for index in comment_positions
+                       if self.comment_posts[index] >= 0 and self._post_matches(self.comment_posts[index], filters)]
+        return positions, digests
+    
+    def recent_comment_days(self, n):
+        """The n latest days with approved comments, oldest first, and their comment counts"""
+        counts = {}
+        for index in reversed(self.comment_order):
+            _, approved, _, day, _, _ = self.comments[index]
+            if not approved:
+                continue
+            if day not in counts:
+                if len(counts) == n:
+                    break
+                counts[day] = 0
+            counts[day] += 1
+        days = sorted(counts)
+        return days, [counts[day] for day in days]
+
+class IncrementalState:
+    """A saved aggregate plus the per-record digests needed to bring it up to date.
+    
+    Posts and comments are compared with their digests in file order. Records
+    past the high-water mark (the number already folded in) are appended to
+    the aggregate and view/like/comment count changes are applied as deltas.
+    Edits and deletions rebuild the aggregate from the digests and the
+    cached word counts, without touching the post bodies again.
+    """
+    
+    VERSION = 5
+    COUNT_FIELDS = ('views', 'likes', 'comments')
+    
+    def __init__(self, aggregate):
+        self.aggregate = aggregate
+        
+        # Digests in file order: TextCache.key() per post, comment_digest() per comment
+        self.post_keys = []
+        self.comments = []
+        
+        # Latest updatedAt seen, for reference
+        self.updated_at = ''
+        
+        # Size and mtime of the data files the state was last updated from
+        self.signature = []
+    
+    def update(self, posts=None, comments=None):
+        """Fold new and changed records in and retract deleted ones.
+        
+        posts or comments may be None when their file is known to be
+        unchanged. Returns the number of posts and comments added, changed
+        and removed.
+        """
+        stats = dict.fromkeys(('posts_added', 'posts_changed', 'posts_removed',
+                               'comments_added', 'comments_changed', 'comments_removed'), 0)
+        if posts is not None:
+            self._update_posts(posts, stats)
+        if comments is not None:
+            self._update_comments(comments, stats)
+        return stats
+    
+    def _update_posts(self, posts, stats):
+        aggregate = self.aggregate
+        old_keys = self.post_keys
+        old_positions = {key: i for i, key in enumerate(old_keys) if key is not None}
+        old_ids = {row.get('id'): i for i, row in enumerate(aggregate.posts)}
+        
+        keys = []
+        entries = []
+        count_changes = []
+        rebuild = False
+        for position, post in enumerate(posts):
+            key = TextCache.key(post)
+            row = {field: post[field] for field in POST_ROW_FIELDS if field in post}
+            self.updated_at = max(self.updated_at, str(post.get('updatedAt', '')))
+            
+            old = old_positions.get(key)
+            if old is None:
+                post_text = aggregate.text_cache.get(post)
+            else:
+                post_text = PostText(None, aggregate.columns.word_counts[old], aggregate.columns.reading_times[old])
+            
+            old = old_ids.get(row.get('id'))
+            if old is not None and (key != old_keys[old] or row != aggregate.posts[old]):
+                stats['posts_changed'] += 1
+            
+            if position < len(old_keys):
+                old_row = aggregate.posts[position]
+                if key is None or key != old_keys[position]:
+                    rebuild = True
+                elif row != old_row:
+                    if any(row.get(field) != old_row.get(field) for field in row.keys() | old_row.keys()
+                           if field not in self.COUNT_FIELDS):
+                        rebuild = True
+                    else:
+                        count_changes.append((position, row))
+            
+            keys.append(key)
+            entries.append((row, post_text))
+        
+        new_ids = {row.get('id') for row, _ in entries}
+        stats['posts_added'] = len(new_ids - old_ids.keys())
+        stats['posts_removed'] = len(old_ids.keys() - new_ids)
+        
+        if rebuild or len(keys) < len(old_keys):
+            aggregate = AnalyticsAggregate(aggregate.text_cache, aggregate.top_k, aggregate.engaging_k,
+                                           aggregate.sketch_k)
+            for row, post_text in entries:
+                aggregate.add_post(row, post_text)
+            for digest in self.comments:
+                aggregate.add_comment_digest(digest)
+        else:
+            for position, row in count_changes:
+                aggregate.update_post_counts(position, row)
+            for row, post_text in entries[len(old_keys):]:
+                aggregate.add_post(row, post_text)
+        
+        self.aggregate = aggregate
+        self.post_keys = keys
+    
+    def _update_comments(self, comments, stats):
+        aggregate = self.aggregate
+        digests = []
+        for comment in comments:
+            digests.append(comment_digest(comment))
+            self.updated_at = max(self.updated_at, str(comment.get('updatedAt', '')))
+        
+        old_ids = {digest[0] for digest in self.comments}
+        new_ids = {digest[0] for digest in digests}
+        stats['comments_added'] = len(new_ids - old_ids)
+        stats['comments_removed'] = len(old_ids - new_ids)
+        stats['comments_changed'] = sum(1 for old, new in zip(self.comments, digests) if old != new and old[0] == new[0])
+        
+        if digests[:len(self.comments)] == self.comments:
+            new_comments = digests[len(self.comments):]
+        else:
+            aggregate.approved_comments = 0
+            aggregate.comment_lengths = QuantileSketch(aggregate.sketch_k)
+            aggregate.comments_per_day = defaultdict(int)
+            aggregate.comments_by_hour = [0] * 24
+            aggregate.comment_index = CommentIndex()
+            new_comments = digests
+        for digest in new_comments:
+            aggregate.add_comment_digest(digest)
+        
+        self.comments = digests
+    
+    def to_dict(self):
+        return {
+            'version': self.VERSION,
+            'aggregate': self.aggregate.to_dict(),
+            'post_keys': self.post_keys,
+            'comments': self.comments,
+            'updated_at': self.updated_at,
+            'signature': self.signature
+        }
+    
+    @classmethod
+    def from_dict(cls, data, text_cache=None, top_k=10):
+        if data.get('version') != cls.VERSION:
+            raise ValueError(f"Unsupported state version: {data.get('version')}")
+        
+        state = cls(AnalyticsAggregate.from_dict(data['aggregate'], text_cache, top_k))
+        state.post_keys = data['post_keys']
+        state.comments = data['comments']
+        state.updated_at = data['updated_at']
+        state.signature = data['signature']
+        return state
+
+class SqlSummary:
+    """Count, total, min, max and exact quantiles of a SQLite column.
+    
+    Stands in for a QuantileSketch when an AnalyticsPartial is finalized from
+    the SQLite store; quantiles are looked up through the column's index.
+    """
+    
+    def __init__(self, conn, table, column, where='1', params=()):
+        self.conn = conn
+        self.table = table
+        self.column = column
+        self.where = where
+        self.params = tuple(params)
+        self.count, self.total, self.min, self.max = conn.execute(
+            f'SELECT COUNT({column}), COALESCE(SUM({column}), 0), MIN({column}), MAX({column}) '
+            f'FROM {table} WHERE {where}', self.params).fetchone()
+    
+    def mean(self):
+        return self.total / self.count if self.count else 0
+    
+    def quantile(self, q):
+        """Value at quantile q (0..1), interpolated like QuantileSketch.quantile"""
+        if not self.count:
+            return 0
+        
+        position = q * (self.count - 1)
+        low = int(math.floor(position))
+        values = [value for value, in self.conn.execute(
+            f'SELECT {self.column} FROM {self.table} WHERE {self.where} AND {self.column} IS NOT NULL '
+            f'ORDER BY {self.column} LIMIT 2 OFFSET ?', self.params + (low,))]
+        fraction = position - low
+        if not fraction or len(values) < 2:
+            return values[0]
+        return (1 - fraction) * values[0] + fraction * values[1]
+    
+    def quantiles(self, qs):
+        return [self.quantile(q) for q in qs]
+
+def connect_owned_db(db_file, schema, schema_version, kind):
+    """Open a SQLite file written by this module, creating or upgrading it as needed.
+    
+    Files are marked with their kind in the meta table. A marked file of another
+    schema version is recreated; a file holding anything else is refused with a
+    ValueError instead of being overwritten.
+    """
+    conn = sqlite3.connect(str(db_file), check_same_thread=False)
+    try:
+        tables = {name for name, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        marker = conn.execute("SELECT value FROM meta WHERE key = 'kind'").fetchone() if 'meta' in tables else None
+    except sqlite3.DatabaseError as e:
+        conn.close()
+        raise ValueError(f"{db_file} is not a readable SQLite file: {e}") from e
+    
+    if tables and marker != (kind,):
+        conn.close()
+        raise ValueError(f"{db_file} is not a blog analytics {kind}; refusing to overwrite it")
+    if tables and conn.execute('PRAGMA user_version').fetchone()[0] != schema_version:
+        conn.close()
+        Path(db_file).unlink()
+        conn = sqlite3.connect(str(db_file), check_same_thread=False)
+    
+    conn.executescript(schema)
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('kind', ?)", (kind,))
+    conn.execute(f'PRAGMA user_version = {schema_version}')
+    return conn
+
+class AnalyticsStore:
+    """Optional SQLite copy of the data files with the section aggregations pushed down to SQL.
+    
+    The JSON files stay the source of truth: sync() compares their size and
+    mtime with the ones recorded at the last sync and, when they changed,
+    rewrites only the rows that differ (positions are the records' order in
+    the files, so first-appearance ordering and top-K ties match the JSON
+    aggregate). Each section method runs just the queries it needs and
+    fills an AnalyticsPartial, which finalizes the result.
+    """
+    
+    SCHEMA_VERSION = 4
+    
+    # Conditions (and their parameters) selecting the posts and comments the sections cover; see view()
+    post_where = '1'
+    post_params = ()
+    comment_where = '1'
+    comment_params = ()
+    
+    POST_COLUMNS = ('position', 'id', 'content_key', 'title', 'category', 'category_name', 'tags', 'date',
+                    'day', 'month', 'weekday', 'week', 'published', 'has_image', 'has_tags', 'views', 'likes', 'comments',
+                    'title_length', 'meta_desc_length', 'word_count', 'reading_time', 'engagement_rate', 'created')
+    COMMENT_COLUMNS = ('position', 'id', 'post_id', 'approved', 'length', 'day', 'day_number', 'time')
+    CATEGORY_COLUMNS = ('position', 'id', 'name', 'slug', 'description', 'active')
+    
+    # Ranking expression of each top-N list, the derived ones from PostColumns.METRICS
+    TOP_ORDER = {'views': 'views', 'comments': 'comments', 'likes': 'likes'}
+    TOP_ORDER.update({metric: ' + '.join(f'{column} * {weight}' for column, weight in weights.items())
+                      for metric, weights in PostColumns.METRICS.items()})
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS posts (
+            position INTEGER PRIMARY KEY, id, content_key TEXT, title TEXT, category TEXT, category_name TEXT,
+            tags TEXT, date TEXT, day INTEGER, month TEXT, weekday INTEGER, week TEXT, published INTEGER,
+            has_image INTEGER,
+            has_tags INTEGER, views INTEGER, likes INTEGER, comments INTEGER, title_length INTEGER,
+            meta_desc_length INTEGER, word_count INTEGER, reading_time INTEGER, engagement_rate REAL,
+            created INTEGER);
+        CREATE TABLE IF NOT EXISTS post_tags (position INTEGER, tag_index INTEGER, tag TEXT,
+                                              PRIMARY KEY (position, tag_index));
+        CREATE TABLE IF NOT EXISTS comments (
+            position INTEGER PRIMARY KEY, id, post_id, approved INTEGER, length INTEGER, day TEXT,
+            day_number INTEGER, time INTEGER, post_position INTEGER);
+        CREATE TABLE IF NOT EXISTS categories (
+            position INTEGER PRIMARY KEY, id, name TEXT, slug TEXT, description TEXT, active INTEGER);
+        CREATE INDEX IF NOT EXISTS posts_category ON posts (category_name, day, views, comments, likes, published);
+        CREATE INDEX IF NOT EXISTS posts_day ON posts (day, views, comments, likes, published);
+        CREATE INDEX IF NOT EXISTS posts_month ON posts (month, views);
+        CREATE INDEX IF NOT EXISTS posts_weekday ON posts (weekday);
+        CREATE INDEX IF NOT EXISTS posts_published ON posts (published);
+        CREATE INDEX IF NOT EXISTS posts_id ON posts (id, category_name, published);
+        CREATE INDEX IF NOT EXISTS posts_views ON posts (views DESC);
+        CREATE INDEX IF NOT EXISTS posts_comments ON posts (comments DESC);
+        CREATE INDEX IF NOT EXISTS posts_likes ON posts (likes DESC);
+        CREATE INDEX IF NOT EXISTS posts_engagement_score ON posts ((views * 1 + comments * 10 + likes * 5) DESC);
+        CREATE INDEX IF NOT EXISTS posts_interactions ON posts ((comments * 1 + likes * 1) DESC);
+        CREATE INDEX IF NOT EXISTS posts_word_count ON posts (word_count);
+        CREATE INDEX IF NOT EXISTS posts_reading_time ON posts (reading_time);
+        CREATE INDEX IF NOT EXISTS posts_engagement_rate ON posts (engagement_rate);
+        CREATE INDEX IF NOT EXISTS post_tags_tag ON post_tags (tag);
+        CREATE INDEX IF NOT EXISTS comments_post_id ON comments (post_id);
+        CREATE INDEX IF NOT EXISTS comments_approved ON comments (approved, day, length, post_id);
+        CREATE INDEX IF NOT EXISTS comments_length ON comments (approved, length);
+        CREATE INDEX IF NOT EXISTS comments_day_number ON comments (day_number);
+        CREATE INDEX IF NOT EXISTS comments_post_position ON comments (approved, post_position, length, time);
+    """
+    
+    def __init__(self, db_file, text_cache=None, top_k=10, engaging_k=5, sketch_k=200):
+        self.db_file = Path(db_file)
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        self.top_k = top_k
+        self.engaging_k = engaging_k
+        self.sketch_k = sketch_k
+        
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = connect_owned_db(self.db_file, self.SCHEMA, self.SCHEMA_VERSION, 'store')
+    
+    def signature(self):
+        """Data file signature recorded at the last sync"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        return json.loads(row[0]) if row else None
+    
+    @property
+    def total_posts(self):
+        return self.conn.execute(f'SELECT COUNT(*) FROM posts WHERE {self.post_where}', self.post_params).fetchone()[0]
+    
+    def post_row(self, position, post, old):
+        """Row of a post; word counts are reused from the old row when the content is unchanged"""
+        key = TextCache.key(post)
+        if old is not None and key is not None and old['content_key'] == key:
+            word_count, reading_time = old['word_count'], old['reading_time']
+        else:
+            post_text = self.text_cache.get(post)
+            word_count, reading_time = post_text.word_count, post_text.reading_time
+        
+        views = int(post.get('views', 0))
+        comments = int(post.get('comments', 0))
+        likes = int(post.get('likes', 0))
+        day = post_day(post.get('date', ''))
+        month, _, week = calendar_keys(day) if day else (None, None, None)
+        post_id = post.get('id')
+        return (
+            position, post_id if isinstance(post_id, (int, str)) else None, key,
+            post.get('title', ''), post.get('category'), post.get('category', 'uncategorized'),
+            json.dumps(post.get('tags') or []),
+            post.get('date', ''), day or None, month, (day + 6) % 7 if day else None, week,
+            int(bool(post.get('published', True))), int(bool(post.get('image'))), int(bool(post.get('tags'))),
+            views, likes, comments, len(post.get('title', '')), len(post.get('metaDescription', '')),
+            word_count, reading_time, ((comments + likes) / views) * 100 if views > 0 else None,
+            post_created(post)
+        )
+    
+    @staticmethod
+    def comment_row(position, comment, old=None):
+        comment_id, approved, length, day, post_id, timestamp = comment_digest(comment)
+        return (position, comment_id, post_id, int(approved), length, day, iso_day(day) or None, timestamp)
+    
+    @staticmethod
+    def category_row(position, category, old=None):
+        return (position, category.get('id'), category.get('name'), category.get('slug'),
+                category.get('description'), int(bool(category.get('active', True))))
+    
+    def _sync_table(self, table, columns, records, make_row):
+        """Rewrite the rows whose record changed and drop the ones past the end; returns the changed rows"""
+        conn = self.conn
+        stored = conn.execute(f'SELECT {", ".join(columns)} FROM {table} ORDER BY position')
+        changed = []
+        count = 0
+        for position, record in enumerate(records):
+            count += 1
+            old = stored.fetchone() if stored is not None else None
+            if old is None:
+                stored = None
+            else:
+                old = dict(zip(columns, old))
+            row = make_row(position, record, old)
+            if old is None or tuple(old.values()) != row:
+                changed.append(row)
+        
+        conn.executemany(f'INSERT OR REPLACE INTO {table} ({", ".join(columns)}) '
+                         f'VALUES ({", ".join("?" * len(columns))})', changed)
+        conn.execute(f'DELETE FROM {table} WHERE position >= ?', (count,))
+        return changed, count
+    
+    def sync(self, posts, comments, categories, signature):
+        """Bring the tables up to date with the data files, in a single transaction"""
+        conn = self.conn
+        with conn:
+            old_count = conn.execute('SELECT COUNT(*) FROM posts').fetchone()[0]
+            changed, count = self._sync_table('posts', self.POST_COLUMNS, posts, self.post_row)
+            conn.execute('DELETE FROM post_tags WHERE position >= ?', (count,))
+            conn.executemany('DELETE FROM post_tags WHERE position = ?', ((row[0],) for row in changed))
+            tags = self.POST_COLUMNS.index('tags')
+            conn.executemany('INSERT INTO post_tags VALUES (?, ?, ?)', (
+                (row[0], index, tag) for row in changed for index, tag in enumerate(json.loads(row[tags]))
+            ))
+            
+            changed_comments, _ = self._sync_table('comments', self.COMMENT_COLUMNS, comments, self.comment_row)
+            if changed or changed_comments or count < old_count:
+                # Join each comment to the first post carrying its postId (through the posts_id index)
+                conn.execute('UPDATE comments SET post_position = '
+                             '(SELECT MIN(position) FROM posts WHERE posts.id = comments.post_id)')
+            self._sync_table('categories', self.CATEGORY_COLUMNS,
+                             (category for category in categories if isinstance(category, dict)),
+                             self.category_row)
+            
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (json.dumps(signature),))
+        self.text_cache.flush()
+    
+    @staticmethod
+    def _post_clause(filters):
+        """SQL condition and parameters selecting the posts an AnalyticsFilter keeps"""
+        clauses = []
+        params = []
+        if filters.start is not None:
+            clauses.append('day >= ?')
+            params.append(filters.start.toordinal())
+        if filters.end is not None:
+            clauses.append('day <= ?')
+            params.append(filters.end.toordinal())
+        if filters.category is not None:
+            clauses.append('category_name = ?')
+            params.append(filters.category)
+        if filters.published is not None:
+            clauses.append('published = ?')
+            params.append(int(filters.published))
+        return ' AND '.join(clauses) or '1', tuple(params)
+    
+    def _comment_clause(self, filters):
+        """SQL condition and parameters selecting the comments an AnalyticsFilter keeps"""
+        clauses = []
+        params = []
+        # day_number is NULL for days iso_day rejects, which no date range keeps
+        if filters.start is not None:
+            clauses.append('day_number >= ?')
+            params.append(filters.start.toordinal())
+        if filters.end is not None:
+            clauses.append('day_number <= ?')
+            params.append(filters.end.toordinal())
+        if filters.category is not None or filters.published is not None:
+            post_where, post_params = self._post_clause(filters._replace(start=None, end=None))
+            clauses.append(f'EXISTS (SELECT 1 FROM posts WHERE posts.id = comments.post_id AND {post_where})')
+            params.extend(post_params)
+        return ' AND '.join(clauses) or '1', tuple(params)
+    
+    def view(self, filters):
+        """This store with its sections restricted to what an AnalyticsFilter keeps"""
+        view = copy.copy(self)
+        view.post_where, view.post_params = self._post_clause(filters)
+        view.comment_where, view.comment_params = self._comment_clause(filters)
+        return view
+    
+    def post_totals(self, start=None, end=None, category=None):
+        """Posts, views, comments and likes of the posts dated start..end (inclusive), optionally in one category.
+        
+        Answered from the covering day or category index alone, in time
+        proportional to the matching posts rather than to the archive.
+        """
+        where, params = self._post_clause(AnalyticsFilter(start, end, category, None))
+        row = self.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(views), 0), COALESCE(SUM(comments), 0), COALESCE(SUM(likes), 0) '
+            f'FROM posts WHERE {where}', params).fetchone()
+        return dict(zip(('posts', 'views', 'comments', 'likes'), row))
+    
+    def _partial(self):
+        partial = AnalyticsPartial(self.top_k, self.engaging_k)
+        partial.total_posts = self.total_posts
+        return partial
+    
+    def _top_rows(self, metric, k):
+        """Rows of the k posts with the largest metric, ties in file order (read off the metric's index)"""
+        rows = self.conn.execute(
+            f"SELECT id, title, COALESCE(category, ''), date, views, likes, comments, "
+            f"{self.TOP_ORDER['engagement_score']}, "
+            f'(SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id AND approved = 1 AND {self.comment_where}) '
+            f'FROM posts WHERE {self.post_where} '
+            f'ORDER BY {self.TOP_ORDER[metric]} DESC, position LIMIT ?', self.comment_params + self.post_params + (k,))
+        return [dict(zip(('id', 'title', 'category', 'date', 'views', 'likes', 'comments', 'engagement_score',
+                          'approved_comments'), row))
+                for row in rows]
+    
+    def _comment_join(self):
+        """Category, approved comments, their length total and first response seconds of each post with approved comments"""
+        return self.conn.execute(
+            'SELECT p.category_name, COUNT(*), SUM(c.length), MAX(MIN(c.time) - p.created, 0) '
+            f'FROM (SELECT post_position, length, time FROM comments WHERE approved = 1 AND {self.comment_where}) AS c '
+            f'JOIN (SELECT position, category_name, created FROM posts WHERE {self.post_where}) AS p '
+            'ON p.position = c.post_position GROUP BY p.position', self.comment_params + self.post_params).fetchall()
+    
+    def post_comment_stats(self, post_id):
+        """Comment statistics of the post with post_id, looked up through the comments_post_id index"""
+        approved, pending, length, first_comment = self.conn.execute(
+            'SELECT COALESCE(SUM(approved), 0), COALESCE(SUM(1 - approved), 0), '
+            'COALESCE(SUM(CASE WHEN approved = 1 THEN length END), 0), MIN(CASE WHEN approved = 1 THEN time END) '
+            f'FROM comments WHERE post_id = ? AND {self.comment_where}', (post_id,) + self.comment_params).fetchone()
+        row = self.conn.execute(f'SELECT created FROM posts WHERE id = ? AND {self.post_where} ORDER BY position LIMIT 1',
+                                (post_id,) + self.post_params).fetchone()
+        response = CommentIndex.response_seconds(first_comment, row[0] if row else None)
+        return comment_stats(approved, pending, length, first_comment, None if response is None else response / 3600)
+    
+    def overview(self):
+        """Finalize the blog overview section"""
+        partial = self._partial()
+        (partial.published_posts, partial.total_views, partial.total_likes) = self.conn.execute(
+            'SELECT COALESCE(SUM(published), 0), COALESCE(SUM(views), 0), COALESCE(SUM(likes), 0) '
+            f'FROM posts WHERE {self.post_where}', self.post_params).fetchone()
+        partial.approved_comments = self.conn.execute(
+            f'SELECT COUNT(*) FROM comments WHERE approved = 1 AND {self.comment_where}',
+            self.comment_params).fetchone()[0]
+        return partial.overview()
+    
+    def content_analysis(self):
+        """Finalize the content analysis section"""
+        partial = self._partial()
+        partial.word_counts = SqlSummary(self.conn, 'posts', 'word_count', self.post_where, self.post_params)
+        partial.reading_times = SqlSummary(self.conn, 'posts', 'reading_time', self.post_where, self.post_params)
+        partial.title_lengths = SqlSummary(self.conn, 'posts', 'title_length', self.post_where, self.post_params)
+        tag_where = '1'
+        if self.post_where != '1':
+            tag_where = f'position IN (SELECT position FROM posts WHERE {self.post_where})'
+        partial.tag_frequency = Counter(dict(self.conn.execute(
+            f'SELECT tag, COUNT(*) FROM post_tags WHERE {tag_where} '
+            'GROUP BY tag ORDER BY MIN(position * 1000000 + tag_index)', self.post_params)))
+        return partial.content_analysis()
+    
+    def engagement_analysis(self, k=None):
+        """Finalize the engagement analysis section"""
+        partial = self._partial()
+        partial.engagement_rates = SqlSummary(self.conn, 'posts', 'engagement_rate',
+                                              f'engagement_rate IS NOT NULL AND {self.post_where}', self.post_params)
+        partial.comment_lengths = SqlSummary(self.conn, 'comments', 'length',
+                                             f'approved = 1 AND {self.comment_where}', self.comment_params)
+        partial.comments_per_day = dict(self.conn.execute(
+            f"SELECT day, COUNT(*) FROM comments WHERE approved = 1 AND day != '' AND {self.comment_where} "
+            'GROUP BY day ORDER BY MIN(position)', self.comment_params))
+        partial.comments_by_hour = dict(self.conn.execute(
+            'SELECT (time % 86400 + 86400) % 86400 / 3600 AS hour, COUNT(*) FROM comments '
+            f'WHERE approved = 1 AND time IS NOT NULL AND {self.comment_where} GROUP BY hour', self.comment_params))
+        joined = self._comment_join()
+        partial.commented_posts = len(joined)
+        partial.unjoined_comments = partial.comment_lengths.count - sum(row[1] for row in joined)
+        partial.response_hours = QuantileSketch(self.sketch_k).extend(row[3] / 3600 for row in joined
+                                                                      if row[3] is not None)
+        partial.top['interactions'] = self._top_rows('interactions', max(k or 0, self.engaging_k))
+        return partial.engagement_analysis(k)
+    
+    def category_performance(self):
+        """Finalize the per-category performance section"""
+        partial = self._partial()
+        partial.categories = {category: list(totals) + [0, 0, 0, 0] for category, *totals in self.conn.execute(
+            'SELECT category_name, COUNT(*), SUM(views), SUM(comments), SUM(likes) FROM posts '
+            f'WHERE {self.post_where} GROUP BY category_name ORDER BY MIN(position)', self.post_params)}
+        for category, approved, length, response in self._comment_join():
+            totals = partial.categories[category]
+            totals[4] += approved
+            totals[5] += length
+            if response is not None:
+                totals[6] += 1
+                totals[7] += response
+        return partial.category_performance()
+    
+    def temporal_analysis(self):
+        """Finalize the temporal analysis section"""
+        partial = self._partial()
+        for month, posts, views in self.conn.execute(
+                f'SELECT month, COUNT(*), SUM(views) FROM posts WHERE month IS NOT NULL AND {self.post_where} '
+                'GROUP BY month ORDER BY MIN(position)', self.post_params):
+            partial.posts_by_month[month] = posts
+            partial.views_by_month[month] = views
+        partial.posts_by_weekday = {WEEKDAY_NAMES[weekday]: posts for weekday, posts in self.conn.execute(
+            f'SELECT weekday, COUNT(*) FROM posts WHERE weekday IS NOT NULL AND {self.post_where} '
+            'GROUP BY weekday ORDER BY MIN(position)', self.post_params)}
+        partial.posts_by_week = dict(self.conn.execute(
+            f'SELECT week, COUNT(*) FROM posts WHERE week IS NOT NULL AND {self.post_where} '
+            'GROUP BY week ORDER BY MIN(position)', self.post_params))
+        return partial.temporal_analysis()
+    
+    def top_performing_content(self, k=None):
+        """Finalize the top performing content section"""
+        partial = self._partial()
+        fetch = max(k or 0, self.top_k)
+        for name in ('views', 'comments', 'likes', 'engagement_score'):
+            partial.top[name] = self._top_rows(name, fetch)
+        return partial.top_performing_content(k)
+    
+    def seo_analysis(self):
+        """Finalize the SEO analysis section"""
+        partial = self._partial()
+        (title_total, partial.optimal_titles, meta_total, partial.optimal_meta_desc,
+         partial.posts_with_images, partial.posts_with_tags) = self.conn.execute(
+            'SELECT COALESCE(SUM(title_length), 0), COALESCE(SUM(title_length BETWEEN 50 AND 60), 0), '
+            'COALESCE(SUM(meta_desc_length), 0), COALESCE(SUM(meta_desc_length BETWEEN 150 AND 160), 0), '
+            f'COALESCE(SUM(has_image), 0), COALESCE(SUM(has_tags), 0) FROM posts WHERE {self.post_where}',
+            self.post_params).fetchone()
+        partial.title_lengths.total = title_total
+        partial.meta_desc_lengths.total = meta_total
+        return partial.seo_analysis()
+    
+    def dashboard_columns(self):
+        """Category names and totals, then the word counts, views and interactions of every post (in file order)"""
+        totals = self.conn.execute(
+            'SELECT category_name, COUNT(*), SUM(views), SUM(comments), SUM(likes) FROM posts '
+            f'WHERE {self.post_where} GROUP BY category_name ORDER BY MIN(position)', self.post_params).fetchall()
+        rows = self.conn.execute(
+            f"SELECT word_count, views, {self.TOP_ORDER['interactions']} FROM posts "
+            f'WHERE {self.post_where} ORDER BY position', self.post_params).fetchall()
+        return ([row[0] for row in totals], [list(row[1:]) for row in totals],
+                [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows])
+
+class TermIndex:
+    """Inverted index of the posts' cleaned text: term -> posts containing it, with term frequencies.
+    
+    Kept in a SQLite file (in memory without one) next to a documents table
+    holding each post's version key, category and counts. sync() only
+    re-tokenizes posts whose content changed, and keeps the vocabulary and
+    per-category term totals up to date as posts are added, edited or
+    removed, so keyword, TF-IDF and word cloud queries never rescan bodies.
+    """
+    
+    SCHEMA_VERSION = 1
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS documents (
+            post_id PRIMARY KEY, position INTEGER, key TEXT, category TEXT, title TEXT,
+            views INTEGER, likes INTEGER, comments INTEGER, length INTEGER);
+        CREATE TABLE IF NOT EXISTS postings (term TEXT, post_id, tf INTEGER, PRIMARY KEY (term, post_id))
+            WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER, tf INTEGER) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS category_terms (category TEXT, term TEXT, df INTEGER, tf INTEGER,
+                                                   PRIMARY KEY (category, term)) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS postings_post_id ON postings (post_id);
+        CREATE INDEX IF NOT EXISTS terms_tf ON terms (tf DESC);
+    """
+    
+    def __init__(self, index_file=None):
+        self.index_file = Path(index_file) if index_file is not None else None
+        if self.index_file is None:
+            self.conn = sqlite3.connect(':memory:', check_same_thread=False)
+            self.conn.executescript(self.SCHEMA)
+        else:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = connect_owned_db(self.index_file, self.SCHEMA, self.SCHEMA_VERSION, 'term index')
+    
+    def signature(self):
+        """Posts file signature recorded at the last sync"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def sync(self, posts, text_cache, signature=None):
+        """Bring the index up to date with posts (first occurrence of each post id wins)"""
+        conn = self.conn
+        documents = {post_id: tuple(row) for post_id, *row in conn.execute(
+            'SELECT post_id, position, key, category, title, views, likes, comments FROM documents')}
+        
+        # Vocabulary and category deltas are summed here and written once at the end
+        term_deltas = defaultdict(lambda: [0, 0])
+        category_deltas = defaultdict(lambda: [0, 0])
+        
+        def count(category, terms, sign):
+            for term, tf in terms.items():
+                delta = term_deltas[term]
+                delta[0] += sign
+                delta[1] += sign * tf
+                delta = category_deltas[category, term]
+                delta[0] += sign
+                delta[1] += sign * tf
+        
+        def remove(post_id, category):
+            terms = dict(conn.execute('SELECT term, tf FROM postings WHERE post_id = ?', (post_id,)))
+            conn.execute('DELETE FROM postings WHERE post_id = ?', (post_id,))
+            count(category, terms, -1)
+            return terms
+        
+        seen = set()
+        stats = {'indexed': 0, 'updated': 0, 'removed': 0}
+        with conn:
+            for position, post in enumerate(posts):
+                post_id = post.get('id')
+                if not isinstance(post_id, (int, str)) or post_id in seen:
+                    continue
+                seen.add(post_id)
+                
+                key = TextCache.key(post)
+                category = post.get('category', 'uncategorized')
+                row = (position, key, category, post.get('title', ''), int(post.get('views', 0)),
+                       int(post.get('likes', 0)), int(post.get('comments', 0)))
+                old = documents.get(post_id)
+                if old == row:
+                    continue
+                
+                if old is not None and old[1:3] == row[1:3]:
+                    # Same content and category: only the counts, title or position changed
+                    conn.execute('UPDATE documents SET position = ?, title = ?, views = ?, likes = ?, comments = ? '
+                                 'WHERE post_id = ?', (position,) + row[3:] + (post_id,))
+                    stats['updated'] += 1
+                    continue
+                
+                terms = remove(post_id, old[2]) if old is not None else None
+                if old is None or old[1] != key:
+                    terms = term_counts(text_cache.get(post, need_text=True).text)
+                conn.executemany('INSERT INTO postings VALUES (?, ?, ?)',
+                                 ((term, post_id, tf) for term, tf in terms.items()))
+                count(category, terms, 1)
+                conn.execute('INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                             (post_id,) + row + (sum(terms.values()),))
+                stats['indexed'] += 1
+            
+            for post_id in documents.keys() - seen:
+                remove(post_id, documents[post_id][2])
+                conn.execute('DELETE FROM documents WHERE post_id = ?', (post_id,))
+                stats['removed'] += 1
+            
+            conn.executemany('INSERT INTO terms VALUES (?, ?, ?) ON CONFLICT (term) DO UPDATE '
+                             'SET df = df + excluded.df, tf = tf + excluded.tf',
+                             ((term, df, tf) for term, (df, tf) in term_deltas.items() if df or tf))
+            conn.executemany('INSERT INTO category_terms VALUES (?, ?, ?, ?) ON CONFLICT (category, term) DO UPDATE '
+                             'SET df = df + excluded.df, tf = tf + excluded.tf',
+                             ((category, term, df, tf) for (category, term), (df, tf) in category_deltas.items()
+                              if df or tf))
+            conn.execute('DELETE FROM terms WHERE df <= 0')
+            conn.execute('DELETE FROM category_terms WHERE df <= 0')
+            if signature is not None:
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (json.dumps(signature),))
+        return stats
+    
+    @property
+    def total_posts(self):
+        return self.conn.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+    
+    def keyword_performance(self, query, k=5):
+        """Views, likes and comments of the posts containing every term of query, plus the k most viewed"""
+        terms = sorted(term_counts(query))
+        if not terms:
+            raise ValueError(f"No searchable term in {query!r}")
+        
+        matches = ('SELECT post_id, SUM(tf) AS tf FROM postings WHERE term IN '
+                   f"({', '.join('?' * len(terms))}) GROUP BY post_id HAVING COUNT(*) = ?")
+        params = tuple(terms) + (len(terms),)
+        posts, occurrences, views, likes, comments = self.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(m.tf), 0), COALESCE(SUM(d.views), 0), COALESCE(SUM(d.likes), 0), '
+            f'COALESCE(SUM(d.comments), 0) FROM ({matches}) AS m JOIN documents d ON d.post_id = m.post_id',
+            params).fetchone()
+        blog_posts, blog_views = self.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(views), 0) FROM documents').fetchone()
+        top_posts = self.conn.execute(
+            f'SELECT d.post_id, d.title, d.views, d.likes, d.comments, m.tf FROM ({matches}) AS m '
+            'JOIN documents d ON d.post_id = m.post_id ORDER BY d.views DESC, d.position LIMIT ?',
+            params + (k,)).fetchall()
+        
+        average_views = views / posts if posts else 0
+        blog_average_views = blog_views / blog_posts if blog_posts else 0
+        return {
+            'terms': terms,
+            'posts': posts,
+            'occurrences': occurrences,
+            'total_views': views,
+            'total_likes': likes,
+            'total_comments': comments,
+            'average_views': round(average_views, 2),
+            'average_likes': round(likes / posts, 2) if posts else 0,
+            'average_comments': round(comments / posts, 2) if posts else 0,
+            'views_vs_blog_average': round(average_views / blog_average_views, 2) if blog_average_views else 0,
+            'top_posts': [
+                {'id': post_id, 'title': title, 'views': post_views, 'likes': post_likes,
+                 'comments': post_comments, 'occurrences': tf}
+                for post_id, title, post_views, post_likes, post_comments, tf in top_posts
+            ]
+        }
+    
+    def category_terms(self, n=10):
+        """The n terms with the highest TF-IDF in each category (categories in order of first appearance).
+        
+        A category's term frequency is its share of the category's terms; the
+        inverse document frequency is log(posts / posts containing the term).
+        """
+        total_posts = self.total_posts
+        document_frequency = dict(self.conn.execute('SELECT term, df FROM terms'))
+        categories = [category for category, in self.conn.execute(
+            'SELECT category FROM documents GROUP BY category ORDER BY MIN(position)')]
+        
+        result = {}
+        for category in categories:
+            rows = self.conn.execute('SELECT term, tf FROM category_terms WHERE category = ?', (category,)).fetchall()
+            length = sum(tf for _, tf in rows)
+            scores = [(tf / length * math.log(total_posts / document_frequency[term]), term)
+                      for term, tf in rows] if length else []
+            best = heapq.nsmallest(n, scores, key=lambda item: (-item[0], item[1]))
+            result[category] = {term: round(score, 4) for score, term in best}
+        return result
+    
+    def term_frequencies(self, n=None):
+        """Occurrences of the n most frequent terms over all posts (all terms when n is None)"""
+        return dict(self.conn.execute('SELECT term, tf FROM terms ORDER BY tf DESC, term LIMIT ?',
+                                      (-1 if n is None else n,)))
+
+class BlogAnalytics:
+    CACHE_VERSION = 4
+    
+    # With engine='auto', archives at least this large use the NumPy columns
+    COLUMNAR_MIN_POSTS = 20000
+    
+    # Posts per task handed to a worker process in parallel mode
+    WORKER_CHUNK_POSTS = 500
+    
+    # Filtered aggregates kept in memory (e.g. the windows a dashboard polls)
+    FILTER_CACHE_SIZE = 8
+    
+    def __init__(self, data_dir=None, cache_dir=None, engine='auto', workers=1, top_k=10,
+                 incremental=False, backend='json', db_file=None, profile=False, compact_records=True,
+                 quantile_error=None):
+        if data_dir is None:
+            # Default path relative to this script
+            script_dir = Path(__file__).parent
+            self.data_dir = script_dir / '../database'
+        else:
+            self.data_dir = Path(data_dir)
+        
+        self.posts_file = self.data_dir / 'posts.json'
+        self.categories_file = self.data_dir / 'categories.json'
+        self.comments_file = self.data_dir / 'comments.json'
+        self.settings_file = self.data_dir / 'settings.json'
+        
+        # Optional on-disk layer for the result cache
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        
+        # 'python' (standard library only), 'numpy' (columnar store) or 'auto'
+        if engine not in ('auto', 'python', 'numpy'):
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
+        
+        # Worker processes for the text analysis (0 means one per CPU)
+        self.workers = workers or os.cpu_count() or 1
+        
+        # Posts per top performing content list
+        self.top_k = check_list_size(top_k, 'top_k')
+        
+        # Rank error bound of the quantile sketches (None: the default size, a 2.5% bound)
+        self.sketch_k = QuantileSketch.k_for_error(quantile_error) if quantile_error else 200
+        
+        # Keep the aggregate on disk and only fold in what changed since the last run
+        if incremental and self.cache_dir is None:
+            print("Incremental analytics need a cache directory; running a full analysis")
+            incremental = False
+        self.incremental = incremental
+        self._state = None
+        self.last_update = None
+        
+        # Derived text per post version, persisted next to the result cache
+        self.text_cache = TextCache(self._cache_file('text', '.sqlite'))
+        
+        # 'json' (aggregate over the data files) or 'sqlite' (indexed copy, see AnalyticsStore)
+        if backend not in ('json', 'sqlite'):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        self.db_file = Path(db_file) if db_file is not None else None
+        self._store = None
+        
+        # Inverted index of the post text, built on the first keyword or topic query
+        self._term_index = None
+        
+        # Opt-in per-stage timings and allocation peaks (see enable_profiling)
+        self.profiler = None
+        if profile:
+            self.enable_profiling()
+        
+        # Posts and comments are loaded as compact records (see Record) unless disabled
+        self.compact_records = compact_records
+        
+        # Data files are loaded lazily, on first access
+        self._posts = None
+        self._categories = None
+        self._comments = None
+        self._settings = None
+        
+        # Single-pass aggregate shared by every get_* method
+        self._aggregate = None
+        
+        # Merged shard partials standing in for the aggregate (see from_partials)
+        self._merged_partial = None
+        
+        # Date-sorted posts and comments, and the aggregates of recent filters
+        self._window_index = None
+        self._filtered = {}
+        
+        # Memoized results, valid for the data file signature they were computed from
+        self._results = {}
+        self._signature = self._data_signature()
+        self._disk_results = None
+    
+    @property
+    def posts(self):
+        if self._posts is None:
+            self._posts = self.read_data_file('posts')
+        return self._posts
+    
+    @posts.setter
+    def posts(self, value):
+        self._posts = value
+        self._drop_results()
+    
+    @property
+    def categories(self):
+        if self._categories is None:
+            self._categories = self.load_data(self.categories_file)
+        return self._categories
+    
+    @categories.setter
+    def categories(self, value):
+        self._categories = value
+        self._drop_results()
+    
+    @property
+    def comments(self):
+        if self._comments is None:
+            self._comments = self.read_data_file('comments')
+        return self._comments
+    
+    @comments.setter
+    def comments(self, value):
+        self._comments = value
+        self._drop_results()
+    
+    @property
+    def settings(self):
+        if self._settings is None:
+            self._settings = self.load_data(self.settings_file)
+        return self._settings
+    
+    @settings.setter
+    def settings(self, value):
+        self._settings = value
+        self._drop_results()
+    
+    def enable_profiling(self, trace_memory=True):
+        """Start recording per-stage timings (and tracemalloc allocation peaks); returns the StageProfiler"""
+        if self.profiler is None:
+            self.profiler = StageProfiler(trace_memory)
+            self.text_cache.profiler = self.profiler
+        return self.profiler
+    
+    def add_profile_hook(self, hook):
+        """Call hook(stage) with every finished ProfileStage, enabling profiling if needed"""
+        self.enable_profiling().hooks.append(hook)
+    
+    def _stage(self, name):
+        """Context manager timing a stage when profiling is enabled"""
+        if self.profiler is None:
+            return nullcontext(ProfileStage(name))
+        return self.profiler.stage(name)
+    
+    def load_data(self, file_path):
+        """Load data from JSON file"""
+        with self._stage('load_data') as stage:
+            try:
+                # Open directly instead of checking exists() first: one round trip less on network mounts
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                print(f"Data file not found: {file_path}")
+                data = []
+            except Exception as e:
+                print(f"Error loading data from {file_path}: {e}")
+                data = []
+            stage.records = len(data) if isinstance(data, list) else 1
+            return data
+    
+    def load_records(self, file_path, record_type):
+        """Load a JSON array file as compact records of record_type"""
+        with self._stage('load_data') as stage:
+            records = RecordList(RecordSource(file_path))
+            try:
+                for element, offset, length in iter_json_array(file_path, offsets=True):
+                    if offset is None or not isinstance(element, dict):
+                        records.append(element)
+                    else:
+                        records.append(record_type(element, records.source, offset, length))
+            except FileNotFoundError:
+                print(f"Data file not found: {file_path}")
+                records = []
+            except Exception as e:
+                print(f"Error loading data from {file_path}: {e}")
+                records = []
+            stage.records = len(records)
+            return records
+    
+    def read_data_file(self, name):
+        """Load one data file ('posts', 'categories', 'comments' or 'settings')"""
+        file_path = getattr(self, f'{name}_file')
+        if self.compact_records and name in RECORD_TYPES:
+            return self.load_records(file_path, RECORD_TYPES[name])
+        return self.load_data(file_path)
+    
+    @classmethod
+    async def aload(cls, data_dir=None, files=DATA_FILES, **kwargs):
+        """Create a BlogAnalytics with its data files read and decoded concurrently.
+        
+        The files (any of 'posts', 'categories', 'comments' and 'settings') are
+        opened, read and decoded in a thread pool, so their I/O latencies
+        overlap. Files not listed stay lazy: they are loaded on first access,
+        or streamed by the statistics that need them, e.g.
+        
+            analytics = await BlogAnalytics.aload(data_dir, files=('posts',))
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        unknown = set(files) - set(DATA_FILES)
+        if unknown:
+            raise ValueError(f"Unknown data files: {', '.join(sorted(unknown))}")
+        
+        analytics = cls(data_dir, **kwargs)
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=max(1, len(files))) as pool:
+            loaded = await asyncio.gather(*(
+                loop.run_in_executor(pool, analytics.read_data_file, name)
+                for name in files
+            ))
+        
+        for name, data in zip(files, loaded):
+            setattr(analytics, name, data)
+        return analytics
+    
+    def _data_signature(self):
+        """Size and mtime of every data file; any change invalidates cached results"""
+        signature = []
+        for file_path in (self.posts_file, self.comments_file, self.categories_file, self.settings_file):
+            try:
+                stat = file_path.stat()
+                signature.append([file_path.name, stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                signature.append([file_path.name, None, None])
+        return signature
+    
+    def _drop_results(self):
+        """Forget the aggregate and memoized results (in memory only)"""
+        self._aggregate = None
+        self._window_index = None
+        self._filtered = {}
+        self._results = {}
+    
+    def invalidate(self):
+        """Discard loaded data and every cached result, including the on-disk cache"""
+        for records in (self._posts, self._comments):
+            if isinstance(records, RecordList):
+                records.source.close()
+        self._posts = None
+        self._categories = None
+        self._comments = None
+        self._settings = None
+        self._drop_results()
+        self._signature = self._data_signature()
+        self._disk_results = {}
+        
+        cache_file = self._results_file()
+        if cache_file is not None and cache_file.exists():
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                print(f"Error removing cache file {cache_file}: {e}")
+    
+    def _cache_file(self, kind='analytics', suffix='.json'):
+        """Location of an on-disk cache file for this data directory"""
+        if self.cache_dir is None:
+            return None
+        
+        digest = hashlib.sha1(str(self.data_dir.resolve()).encode('utf-8')).hexdigest()[:12]
+        return self.cache_dir / f'{kind}_{digest}{suffix}'
+    
+    def _results_file(self):
+        """On-disk results cache for this data directory and the settings that shape the results"""
+        settings = f'{self.backend}|{self.engine}|{self.top_k}|{self.sketch_k}'
+        digest = hashlib.sha1(settings.encode('utf-8')).hexdigest()[:8]
+        return self._cache_file('analytics', f'_{digest}.json')
+    
+    def _load_disk_results(self):
+        """Read the on-disk results if they were computed from the current data files"""
+        self._disk_results = {}
+        cache_file = self._results_file()
+        if cache_file is None or not cache_file.exists():
+            return
+        
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return
+        
+        if cached.get('version') == self.CACHE_VERSION and cached.get('signature') == self._signature:
+            self._disk_results = cached.get('results', {})
+    
+    def _save_disk_results(self):
+        """Write the memoized results through to the on-disk cache"""
+        cache_file = self._results_file()
+        if cache_file is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    'version': self.CACHE_VERSION,
+                    'signature': self._signature,
+                    'results': self._disk_results
+                }, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError) as e:
+            print(f"Error writing cache file {cache_file}: {e}")
+    
+    def _memoize(self, key, compute, stage=None):
+        """Return a cached result for key, recomputing it when the data files change.
+        
+        A recomputation is profiled as the given stage (cache hits are not).
+        """
+        signature = self._data_signature()
+        if signature != self._signature:
+            self.invalidate()
+        
+        if key not in self._results:
+            if self._disk_results is None:
+                self._load_disk_results()
+            
+            if key in self._disk_results:
+                self._results[key] = self._disk_results[key]
+            else:
+                with self._stage(stage or key):
+                    self._results[key] = compute()
+                if self.cache_dir is not None:
+                    # Round-trip through JSON so memory and disk hits look the same
+                    self._disk_results[key] = json.loads(json.dumps(self._results[key]))
+                    self._results[key] = self._disk_results[key]
+                    self._save_disk_results()
+        
+        # Callers get their own copy so the cached value can't be mutated
+        return copy.deepcopy(self._results[key])
+    
+    def iter_data(self, file_path, fields=None):
+        """Iterate over the records of a JSON array file without loading it whole.
+        
+        A file that cannot be read or decoded to the end raises ValueError, so a
+        partial pass is never memoized or cached as if it were complete.
+        """
+        if not file_path.exists():
+            print(f"Data file not found: {file_path}")
+            return
+        try:
+            yield from iter_json_array(file_path, fields)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Error loading data from {file_path}: {e}") from e
+    
+    def _use_numpy(self, post_count):
+        """Whether the selected engine reduces the post columns with NumPy"""
+        if self.engine == 'python':
+            return False
+        if self.engine == 'numpy':
+            return True
+        if post_count < self.COLUMNAR_MIN_POSTS:
+            return False
+        try:
+            import numpy
+        except ImportError:
+            return False
+        return True
+    
+    def _get_aggregate(self):
+        """Build (once) the aggregate holding every section's accumulators.
+        
+        Records already loaded in memory are reused; otherwise posts.json and
+        comments.json are streamed straight into the aggregate, one record at
+        a time, so memory does not grow with the size of the files.
+        """
+        if self._merged_partial is not None:
+            return self._merged_partial
+        
+        if self._aggregate is None and self.incremental:
+            with self._stage('incremental_update') as stage:
+                self._aggregate = self._update_state()
+                stage.records = sum(self.last_update.values())
+            if self._use_numpy(self._aggregate.total_posts):
+                self._aggregate.columns.use_numpy()
+        
+        if self._aggregate is None:
+            aggregate = AnalyticsAggregate(self.text_cache, top_k=self.top_k, sketch_k=self.sketch_k)
+            
+            with self._stage('aggregate_posts') as stage:
+                if self._posts is not None:
+                    posts = self._posts
+                else:
+                    posts = self.iter_data(self.posts_file)
+                if self.workers > 1:
+                    self._add_posts_parallel(aggregate, posts)
+                else:
+                    for post in posts:
+                        aggregate.add_post(post)
+                self.text_cache.flush(prune=True)
+                stage.records = aggregate.total_posts
+            
+            with self._stage('aggregate_comments') as stage:
+                if self._comments is not None:
+                    comments = self._comments
+                else:
+                    comments = self.iter_data(self.comments_file, COMMENT_FIELDS)
+                for comment in comments:
+                    aggregate.add_comment(comment)
+                    stage.records += 1
+            
+            if self._use_numpy(aggregate.total_posts):
+                aggregate.columns.use_numpy()
+            self._aggregate = aggregate
+        return self._aggregate
+    
+    def _get_store(self):
+        """Open the SQLite store (once) and sync it whenever the data files changed"""
+        if self._store is None:
+            db_file = self.db_file or self._cache_file('store', '.sqlite') or self.data_dir / 'analytics.sqlite'
+            self._store = AnalyticsStore(db_file, self.text_cache, top_k=self.top_k, sketch_k=self.sketch_k)
+        
+        signature = self._data_signature()
+        if self._store.signature() != signature:
+            with self._stage('sqlite_sync') as stage:
+                posts = self._posts if self._posts is not None else self.iter_data(self.posts_file)
+                if self._comments is not None:
+                    comments = self._comments
+                else:
+                    comments = self.iter_data(self.comments_file, COMMENT_FIELDS)
+                self._store.sync(posts, comments, self.categories, signature)
+                stage.records = self._store.total_posts
+        return self._store
+    
+    def _get_term_index(self):
+        """Open the term index (once) and sync it whenever posts.json changed"""
+        if self._merged_partial is not None:
+            raise ValueError("Term queries need the data files; merged partials only hold totals")
+        if self._term_index is None:
+            self._term_index = TermIndex(self._cache_file('terms', '.sqlite'))
+        
+        signature = self._data_signature()[0]
+        if self._term_index.signature() != signature:
+            with self._stage('term_index_sync') as stage:
+                posts = self._posts if self._posts is not None else self.iter_data(self.posts_file)
+                stats = self._term_index.sync(posts, self.text_cache, signature)
+                self.text_cache.flush()
+                stage.records = stats['indexed']
+        return self._term_index
+    
+    def _get_window_index(self):
+        """Build (once) the date-sorted index of the aggregate's posts and of the comments"""
+        if self._window_index is None:
+            aggregate = self._get_aggregate()
+            if self._comments is not None:
+                comments = self._comments
+            else:
+                comments = self.iter_data(self.comments_file, COMMENT_FIELDS)
+            with self._stage('window_index') as stage:
+                self._window_index = WindowIndex(aggregate, comments)
+                stage.records = len(self._window_index.comments)
+        return self._window_index
+    
+    def _get_source(self, filters=None):
+        """What the get_* methods finalize their sections from: the SQLite store or the aggregate.
+        
+        With an AnalyticsFilter, a view of the store restricted by SQL
+        conditions, or an aggregate of the posts and comments the window
+        index selects (the last FILTER_CACHE_SIZE of them are kept).
+        """
+        if filters is not None and self._merged_partial is not None:
+            raise ValueError("Filters need the data files; merged partials only hold the shards' totals")
+        
+        if self.backend == 'sqlite' and self._merged_partial is None:
+            store = self._get_store()
+            return store if filters is None else store.view(filters)
+        
+        aggregate = self._get_aggregate()
+        if filters is None:
+            return aggregate
+        
+        if filters not in self._filtered:
+            if len(self._filtered) >= self.FILTER_CACHE_SIZE:
+                del self._filtered[next(iter(self._filtered))]
+            self._filtered[filters] = aggregate.subset(*self._get_window_index().select(filters))
+        return self._filtered[filters]
+    
+    @staticmethod
+    def _filter_key(key, filters):
+        """Memoization key of a section under an AnalyticsFilter"""
+        if filters is None:
+            return key
+        return '|'.join([key] + ['' if part is None else str(part) for part in filters])
+    
+    def _load_state(self):
+        """Read the saved incremental state, or start an empty one"""
+        state_file = self._cache_file('state')
+        if state_file.exists():
+            try:
+                with open(state_file, 'r') as f:
+                    return IncrementalState.from_dict(json.load(f), self.text_cache, self.top_k)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Ignoring unreadable state file {state_file}: {e}")
+        return IncrementalState(AnalyticsAggregate(self.text_cache, top_k=self.top_k, sketch_k=self.sketch_k))
+    
+    def _save_state(self):
+        """Write the incremental state to the cache directory"""
+        state_file = self._cache_file('state')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = state_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                # dumps() runs the C encoder; dump() to a file would not
+                f.write(json.dumps(self._state.to_dict()))
+            os.replace(tmp_file, state_file)
+        except (OSError, TypeError) as e:
+            print(f"Error writing state file {state_file}: {e}")
+    
+    def _update_state(self):
+        """Bring the saved aggregate up to date with the data files and save it again"""
+        if self._state is None:
+            self._state = self._load_state()
+        
+        # Files whose size and mtime did not change since the last update are skipped
+        signature = self._data_signature()
+        unchanged = [entry for entry in signature if entry in self._state.signature]
+        posts = self._posts
+        if posts is None and signature[0] not in unchanged:
+            posts = self.iter_data(self.posts_file)
+        comments = self._comments
+        if comments is None and signature[1] not in unchanged:
+            comments = self.iter_data(self.comments_file, COMMENT_FIELDS)
+        
+        try:
+            self.last_update = self._state.update(posts, comments)
+        except Exception:
+            # A half-applied update is neither reused nor saved
+            self._state = None
+            raise
+        self._state.signature = signature
+        
+        # Unchanged posts never reach the text cache; keep their entries
+        self.text_cache.seen.update(key for key in self._state.post_keys if key is not None)
+        self.text_cache.flush(prune=True)
+        
+        if any(self.last_update.values()) or unchanged != signature:
+            self._save_state()
+        return self._state.aggregate
+    
+    def write_partial(self, output_file=None):
+        """Write this data set's mergeable partial aggregate as JSON (to stdout by default)"""
+        partial = self._get_aggregate()
+        with self._stage('write_partial'):
+            if isinstance(partial, AnalyticsAggregate):
+                partial = partial.to_partial()
+            data = json.dumps(partial.to_dict())
+        if output_file:
+            with open(output_file, 'w') as f:
+                f.write(data)
+            print(f"Partial aggregate saved to: {output_file}")
+        else:
+            print(data)
+        return data
+    
+    @classmethod
+    def from_partials(cls, partial_files, **kwargs):
+        """Analytics over the merged partials of several shards.
+        
+        Every section, the insights and the report are then computed from the
+        merged partial instead of the data files.
+        """
+        merged = AnalyticsPartial()
+        for partial_file in partial_files:
+            with open(partial_file, 'r') as f:
+                merged.merge(AnalyticsPartial.from_dict(json.load(f)))
+        
+        analytics = cls(**kwargs)
+        analytics._merged_partial = merged
+        return analytics
+    
+    def _add_posts_parallel(self, aggregate, posts):
+        """Fold posts into the aggregate, analyzing their text in worker processes.
+        
+        Posts are sent to the pool in chunks as they are read; chunks are folded
+        back in their original order, so the results match the serial pass.
+        Only posts missing from the text cache are stripped by the workers.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        text_cache = self.text_cache
+        in_flight = deque()
+        
+        def fold(limit):
+            while len(in_flight) > limit:
+                chunk, cached, future = in_flight.popleft()
+                entries, tag_frequency = future.result()
+                computed = iter(entries)
+                for post, entry in zip(chunk, cached):
+                    if entry is None:
+                        entry = next(computed)
+                        text_cache.store(post, entry)
+                    aggregate.add_post(post, entry, count_tags=False)
+                aggregate.tag_frequency.update(tag_frequency)
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for chunk in iter_chunks(posts, self.WORKER_CHUNK_POSTS):
+                cached = [text_cache.lookup(post) for post in chunk]
+                contents = [post.get('content', '') for post, entry in zip(chunk, cached) if entry is None]
+                tag_lists = [post.get('tags', []) for post in chunk]
+                future = pool.submit(analyze_text_chunk, contents, tag_lists, text_cache.keep_text)
+                in_flight.append((chunk, cached, future))
+                
+                # Bound the number of chunks held in memory
+                fold(self.workers * 2)
+            fold(0)
+    
+    def get_blog_overview(self, **filters):
+        """Get basic blog statistics.
+        
+        Every section takes the filters start and end (dates or 'YYYY-MM-DD',
+        inclusive), category and published; see make_filter.
+        """
+        filters = make_filter(**filters)
+        return self._memoize(self._filter_key('overview', filters), lambda: self._get_source(filters).overview(),
+                             'get_blog_overview')
+    
+    def get_content_analysis(self, **filters):
+        """Analyze content characteristics"""
+        filters = make_filter(**filters)
+        return self._memoize(self._filter_key('content', filters),
+                             lambda: self._get_source(filters).content_analysis(),
+                             'get_content_analysis')
+    
+    def get_engagement_analysis(self, k=5, **filters):
+        """Analyze reader engagement metrics (k most engaging posts)"""
+        check_list_size(k)
+        filters = make_filter(**filters)
+        return self._memoize(self._filter_key(f'engagement_{k}', filters),
+                             lambda: self._get_source(filters).engagement_analysis(k),
+                             'get_engagement_analysis')
+    
+    def get_post_comment_stats(self, post_id, **filters):
+        """Approved and pending comments, average comment length and first response time of one post.
+        
+        Looked up in the postId-keyed comment index (or the SQLite comments
+        table), not by scanning the comments.
+        """
+        filters = make_filter(**filters)
+        if self._merged_partial is not None:
+            raise ValueError("Per-post comment statistics need the data files; merged partials only hold totals")
+        if self._data_signature() != self._signature:
+            self.invalidate()
+        with self._stage('get_post_comment_stats'):
+            return self._get_source(filters).post_comment_stats(post_id)
+    
+    def get_keyword_performance(self, query, k=5):
+        """How the posts mentioning every term of query perform (views, likes, comments, k most viewed).
+        
+        Answered from the inverted term index, without reading post bodies.
+        """
+        with self._stage('get_keyword_performance'):
+            return self._get_term_index().keyword_performance(query, k)
+    
+    def get_category_terms(self, n=10):
+        """The n most distinctive terms (by TF-IDF) of each category"""
+        return self._memoize(f'category_terms|{n}', lambda: self._get_term_index().category_terms(n))
+    
+    def get_term_frequencies(self, n=100):
+        """Occurrences of the n most frequent terms of the post text"""
+        return self._memoize(f'term_frequencies|{n}', lambda: self._get_term_index().term_frequencies(n))
+    
+    def get_category_performance(self, **filters):
+        """Analyze performance by category"""
+        filters = make_filter(**filters)
+        return self._memoize(self._filter_key('category', filters),
+                             lambda: self._get_source(filters).category_performance(),
+                             'get_category_performance')
+    
+    def get_temporal_analysis(self, **filters):
+        """Analyze posting patterns and trends over time"""
+        filters = make_filter(**filters)
+        return self._memoize(self._filter_key('temporal', filters),
+                             lambda: self._get_source(filters).temporal_analysis(),
+                             'get_temporal_analysis')
+    
+    def get_top_performing_content(self, k=None, **filters):
+        """Get top performing posts by various metrics (k per list, default top_k)"""
+        k = self.top_k if k is None else check_list_size(k)
+        filters = make_filter(**filters)
+        return self._memoize(self._filter_key(f'top_content_{k}', filters),
+                             lambda: self._get_source(filters).top_performing_content(k),
+                             'get_top_performing_content')
+    
+    def get_seo_analysis(self, **filters):
+        """Analyze SEO-related metrics"""
+        filters = make_filter(**filters)
+        return self._memoize(self._filter_key('seo', filters), lambda: self._get_source(filters).seo_analysis(),
+                             'get_seo_analysis')
+    
+    def generate_insights(self, **filters):
+        """Generate actionable insights based on analytics"""
+        return self._memoize(self._filter_key('insights', make_filter(**filters)),
+                             lambda: self._compute_insights(**filters), 'generate_insights')
+    
+    def warm(self):
+        """Compute (or load from the caches) every section and the insights"""
+        self.get_blog_overview()
+        self.get_content_analysis()
+        self.get_engagement_analysis()
+        self.get_category_performance()
+        self.get_temporal_analysis()
+        self.get_top_performing_content()
+        self.get_seo_analysis()
+        self.generate_insights()
+    
+    def _compute_insights(self, **filters):
+        """Build the insight messages from the section results"""
+        insights = []
+        
+        overview = self.get_blog_overview(**filters)
+        content_analysis = self.get_content_analysis(**filters)
+        engagement_analysis = self.get_engagement_analysis(**filters)
+        category_performance = self.get_category_performance(**filters)
+        temporal_analysis = self.get_temporal_analysis(**filters)
+        seo_analysis = self.get_seo_analysis(**filters)
+        
+        # Content insights
+        if overview['average_views_per_post'] > 500:
+            insights.append("🎉 Excellent! Your posts are getting great visibility with high average views.")
+        elif overview['average_views_per_post'] > 100:
+            insights.append("👍 Good readership! Consider promoting your content more to increase views.")
+        else:
+            insights.append("📈 Focus on SEO optimization and content promotion to increase visibility.")
+        
+        # Engagement insights
+        if engagement_analysis.get('engagement_rate_stats', {}).get('average', 0) > 5:
+            insights.append("💬 Outstanding engagement! Your readers are actively interacting with your content.")
+        elif engagement_analysis.get('engagement_rate_stats', {}).get('average', 0) > 2:
+            insights.append("👥 Good engagement levels. Consider adding more call-to-actions to boost interaction.")
+        else:
+            insights.append("🔄 Low engagement. Try asking questions and encouraging comments at the end of posts.")
+        
+        # Content length insights
+        avg_words = content_analysis.get('word_count_stats', {}).get('average', 0)
+        if avg_words > 1500:
+            insights.append("📚 Your posts are comprehensive and detailed, which is great for SEO and authority.")
+        elif avg_words > 800:
+            insights.append("📝 Good post length for readability and SEO. Consider varying length based on topic.")
+        else:
+            insights.append("📄 Consider writing longer, more detailed posts to improve SEO and provide more value.")
+        
+        # Category insights
+        if category_performance:
+            best_category = max(category_performance.items(), key=lambda x: x[1]['average_views'])
+            insights.append(f"🏆 '{best_category[0]}' is your top-performing category with {best_category[1]['average_views']:.0f} average views.")
+        
+        # Publishing frequency insights
+        avg_posts_per_month = temporal_analysis.get('average_posts_per_month', 0)
+        if avg_posts_per_month >= 4:
+            insights.append("📅 Great posting consistency! Regular publishing helps build audience loyalty.")
+        elif avg_posts_per_month >= 2:
+            insights.append("📆 Good posting frequency. Consider increasing to 3-4 posts per month for better growth.")
+        else:
+            insights.append("⏰ Increase posting frequency to at least 2-3 posts per month for better engagement.")
+        
+        # SEO insights
+        seo_title_percentage = seo_analysis.get('title_analysis', {}).get('optimal_percentage', 0)
+        if seo_title_percentage < 50:
+            insights.append("🔍 Optimize your post titles to 50-60 characters for better SEO performance.")
+        
+        seo_image_percentage = seo_analysis.get('content_optimization', {}).get('posts_with_images_percentage', 0)
+        if seo_image_percentage < 80:
+            insights.append("🖼️ Add featured images to more posts to improve visual appeal and social sharing.")
+        
+        return insights
+    
+    def _dashboard_data(self):
+        """Data behind each dashboard panel, computed once (plain values, picklable for workers)"""
+        if self._merged_partial is not None:
+            raise ValueError("Visualizations need the data files; merged partials only hold the shards' totals")
+        overview = self.get_blog_overview()
+        category_performance = self.get_category_performance()
+        engagement_analysis = self.get_engagement_analysis()
+        temporal_analysis = self.get_temporal_analysis()
+        content_analysis = self.get_content_analysis()
+        seo_analysis = self.get_seo_analysis()
+        category_names, category_totals, word_counts, views, interactions = self._get_source().dashboard_columns()
+        
+        top_posts = engagement_analysis.get('most_engaging_posts', [])[:5]
+        posts_by_month = temporal_analysis.get('posts_by_month', {})
+        months = sorted(posts_by_month.keys())
+        most_used_tags = content_analysis.get('most_used_tags', {})
+        comments_per_day = engagement_analysis.get('comment_stats', {}).get('comments_per_day', {})
+        dates = sorted(heapq.nlargest(30, comments_per_day))  # Last 30 days
+        posts_by_weekday = temporal_analysis.get('posts_by_weekday', {})
+        
+        # Average views, comments and likes per category
+        performance_matrix = [[views / posts, comments / posts, likes / posts] if posts else [0, 0, 0]
+                              for posts, views, comments, likes in category_totals]
+        
+        return {
+            'overview': {
+                'values': [overview['published_posts'], overview['total_views'],
+                           overview['total_comments'], overview['total_likes']]
+            },
+            'categories': {
+                'categories': list(category_performance.keys()),
+                'average_views': [stats['average_views'] for stats in category_performance.values()]
+            },
+            'engaging_posts': {
+                'titles': [post['title'][:20] + '...' if len(post['title']) > 20 else post['title']
+                           for post in top_posts],
+                'scores': [post['comments'] + post['likes'] for post in top_posts]
+            },
+            'publishing_timeline': {
+                'months': months,
+                'counts': [posts_by_month[month] for month in months]
+            },
+            'word_counts': {'word_counts': word_counts},
+            'tags': {
+                'tags': list(most_used_tags.keys())[:10],
+                'counts': list(most_used_tags.values())[:10]
+            },
+            'views_engagement': {
+                'views': views,
+                'engagement': interactions
+            },
+            'seo': {
+                'percentages': [
+                    seo_analysis.get('title_analysis', {}).get('optimal_percentage', 0),
+                    seo_analysis.get('content_optimization', {}).get('posts_with_images_percentage', 0),
+                    seo_analysis.get('content_optimization', {}).get('posts_with_tags_percentage', 0)
+                ]
+            },
+            'comments_timeline': {
+                'dates': dates,
+                'counts': [comments_per_day.get(date, 0) for date in dates]
+            },
+            'weekdays': {
+                'counts': [posts_by_weekday.get(day, 0) for day in WEEKDAY_NAMES] if posts_by_weekday else []
+            },
+            'heatmap': {
+                'categories': category_names,
+                'metrics': ['Views', 'Comments', 'Likes'],
+                'matrix': performance_matrix
+            }
+        }
+    
+    def create_visualizations(self, output_dir=None, dpi=300, image_format='png'):
+        """Create comprehensive data visualizations; returns the files written.
+        
+        With several workers (and a raster format), the dashboard panels are
+        rendered in worker processes on the Agg backend and composited, while
+        the word cloud is rendered in this process.
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format: {image_format}")
+        
+        if output_dir is None:
+            output_dir = self.data_dir / '../reports'
+        else:
+            output_dir = Path(output_dir)
+        
+        with self._stage('dashboard_data'):
+            panels = self._dashboard_data()
+        output_dir.mkdir(exist_ok=True)
+        has_posts = self._get_source().total_posts > 0
+        output_file = output_dir / f'blog_analytics_dashboard.{image_format}'
+        word_cloud_file = None
+        
+        if self.workers > 1 and image_format != 'svg':
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(render_panel_image, index, panels[name], dpi)
+                           for index, (name, _, _) in enumerate(DASHBOARD_PANELS)]
+                
+                # Create word cloud if there are enough posts
+                if has_posts:
+                    word_cloud_file = self.create_word_cloud(output_dir, dpi, image_format)
+                
+                with self._stage('render_panels') as stage:
+                    images = [future.result() for future in futures]
+                    stage.records = len(images)
+            with self._stage('save_dashboard'):
+                self._save_dashboard_composite(images, output_file, dpi, image_format)
+        else:
+            self._save_dashboard_figure(panels, output_file, dpi, image_format)
+            
+            # Create word cloud if there are enough posts
+            if has_posts:
+                word_cloud_file = self.create_word_cloud(output_dir, dpi, image_format)
+        
+        return [output_file] + ([word_cloud_file] if word_cloud_file is not None else [])
+    
+    def _save_dashboard_figure(self, panels, output_file, dpi, image_format):
+        """Draw every panel into one figure and save it"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set up the plotting style
+        plt.style.use('default')
+        sns.set_palette("husl")
+        
+        # Create a comprehensive dashboard
+        rows, cols = DASHBOARD_GRID
+        fig = plt.figure(figsize=(cols * DASHBOARD_CELL_INCHES, rows * DASHBOARD_CELL_INCHES))
+        for name, draw, (row, col, span) in DASHBOARD_PANELS:
+            first = row * cols + col + 1
+            with self._stage(f'panel.{name}'):
+                draw(plt.subplot(rows, cols, (first, first + span - 1)), panels[name])
+        
+        plt.tight_layout()
+        
+        # Save the comprehensive dashboard (the panels' artists are rasterized here)
+        with self._stage('save_dashboard'):
+            plt.savefig(output_file, dpi=dpi, bbox_inches='tight', format=image_format)
+        print(f"Analytics dashboard saved to: {output_file}")
+        
+        plt.close()
+    
+    def _save_dashboard_composite(self, images, output_file, dpi, image_format):
+        """Place the panel images rendered by the workers on the dashboard grid and save it"""
+        import numpy as np
+        from PIL import Image
+        
+        rows, cols = DASHBOARD_GRID
+        cell_height, cell_width = images[0].shape[:2]
+        canvas = np.full((rows * cell_height, cols * cell_width, 4), 255, dtype=np.uint8)
+        for image, (_, _, (row, col, span)) in zip(images, DASHBOARD_PANELS):
+            height = min(image.shape[0], cell_height)
+            width = min(image.shape[1], cell_width * span)
+            top, left = row * cell_height, col * cell_width
+            canvas[top:top + height, left:left + width] = image[:height, :width]
+        
+        Image.fromarray(canvas).convert('RGB').save(output_file, format=image_format.upper(), dpi=(dpi, dpi))
+        print(f"Analytics dashboard saved to: {output_file}")
+    
+    def word_cloud_frequencies(self, n=100):
+        """The n most frequent terms of the blog, ties by term.
+        
+        Body terms come from the term index; title and tag terms are streamed
+        from the loaded posts, so no post body is read or concatenated.
+        """
+        frequencies = Counter(self._get_term_index().term_frequencies())
+        for post in self.posts:
+            frequencies.update(term_counts(post.get('title', '')))
+            frequencies.update(term_counts(' '.join(post.get('tags', []))))
+        return dict(sorted(frequencies.items(), key=lambda item: (-item[1], item[0]))[:n])
+    
+    def create_word_cloud(self, output_dir, dpi=300, image_format='png'):
+        """Create a word cloud from blog content; returns the image file (None when none was made)"""
+        with self._stage('word_cloud'):
+            return self._create_word_cloud(Path(output_dir), dpi, image_format)
+    
+    def _create_word_cloud(self, output_dir, dpi, image_format):
+        try:
+            import shutil
+            import matplotlib.pyplot as plt
+            from wordcloud import WordCloud
+            
+            word_cloud_options = {
+                'width': 800,
+                'height': 400,
+                'background_color': 'white',
+                'colormap': 'viridis',
+                'max_words': 100,
+                'random_state': 42
+            }
+            
+            with self._stage('word_cloud_frequencies'):
+                frequencies = self.word_cloud_frequencies(word_cloud_options['max_words'])
+            if not frequencies:
+                return None
+            
+            # The image only depends on the frequency table and the rendering options,
+            # so a cached rendering of the same table is reused as is
+            output_file = output_dir / f'blog_wordcloud.{image_format}'
+            key = hashlib.sha1(json.dumps([list(frequencies.items()), word_cloud_options, dpi, image_format],
+                                          ensure_ascii=False).encode('utf-8')).hexdigest()
+            cached_file = self._cache_file('wordcloud', f'.{image_format}')
+            key_file = self._cache_file('wordcloud', '.key')
+            if cached_file is not None and cached_file.exists() and key_file.exists() and key_file.read_text() == key:
+                shutil.copyfile(cached_file, output_file)
+                print(f"Word cloud unchanged, reused: {output_file}")
+                return output_file
+            
+            wordcloud = WordCloud(**word_cloud_options).generate_from_frequencies(frequencies)
+            plt.figure(figsize=(10, 5))
+            plt.imshow(wordcloud, interpolation='bilinear')
+            plt.axis('off')
+            plt.title('Blog Content Word Cloud', fontsize=16, fontweight='bold')
+            
+            with self._stage('save_word_cloud'):
+                plt.savefig(output_file, dpi=dpi, bbox_inches='tight', format=image_format)
+            print(f"Word cloud saved to: {output_file}")
+            plt.close()
+            
+            if cached_file is not None:
+                try:
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(output_file, cached_file)
+                    key_file.write_text(key)
+                except OSError as e:
+                    print(f"Error caching word cloud {cached_file}: {e}")
+            return output_file
+                
+        except ImportError:
+            print("WordCloud library not available. Skipping word cloud generation.")
+        except Exception as e:
+            print(f"Error creating word cloud: {e}")
+        return None
+    
+    def generate_report(self, output_file=None, **filters):
+        """Generate a comprehensive analytics report (of the posts and comments the filters keep)"""
+        with self._stage('generate_report'):
+            return self._generate_report(output_file, **filters)
+    
+    def _generate_report(self, output_file=None, **filters):
+        overview = self.get_blog_overview(**filters)
+        content_analysis = self.get_content_analysis(**filters)
+        engagement_analysis = self.get_engagement_analysis(**filters)
+        category_performance = self.get_category_performance(**filters)
+        temporal_analysis = self.get_temporal_analysis(**filters)
+        top_content = self.get_top_performing_content(**filters)
+        seo_analysis = self.get_seo_analysis(**filters)
+        insights = self.generate_insights(**filters)
+        
+        scope = make_filter(**filters)
+        scope_line = ''
+        if scope is not None:
+            scope_line = 'Filters: ' + ', '.join(f'{name} {value}' for name, value in scope._asdict().items()
+                                                 if value is not None) + '\n'
+        
+        report = f"""
+# Blog Analytics Report
+Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{scope_line}
+## Executive Summary
+- **Total Posts:** {overview['total_posts']} ({overview['published_posts']} published, {overview['draft_posts']} drafts)
+- **Total Views:** {overview['total_views']:,}
+- **Total Comments:** {overview['total_comments']}
+- **Total Likes:** {overview['total_likes']}
+- **Average Views per Post:** {overview['average_views_per_post']}
+- **Average Comments per Post:** {overview['average_comments_per_post']}
+
+## Content Analysis
+
+### Word Count Statistics
+- **Average Words per Post:** {content_analysis.get('word_count_stats', {}).get('average', 0)}
+- **Shortest Post:** {content_analysis.get('word_count_stats', {}).get('min', 0)} words
+- **Longest Post:** {content_analysis.get('word_count_stats', {}).get('max', 0)} words
+- **Median Length:** {content_analysis.get('word_count_stats', {}).get('median', 0)} words
+- **90th / 99th Percentile:** {content_analysis.get('word_count_stats', {}).get('p90', 0)} / {content_analysis.get('word_count_stats', {}).get('p99', 0)} words
+
+### Reading Time
+- **Average Reading Time:** {content_analysis.get('reading_time_stats', {}).get('average', 0)} minutes
+- **Range:** {content_analysis.get('reading_time_stats', {}).get('min', 0)}-{content_analysis.get('reading_time_stats', {}).get('max', 0)} minutes
+- **Median / 90th Percentile:** {content_analysis.get('reading_time_stats', {}).get('median', 0)} / {content_analysis.get('reading_time_stats', {}).get('p90', 0)} minutes
+
+### Tags and Topics
+- **Total Unique Tags:** {content_analysis.get('total_unique_tags', 0)}
+- **Most Popular Tags:**
+"""
+        
+        most_used_tags = content_analysis.get('most_used_tags', {})
+        for tag, count in list(most_used_tags.items())[:10]:
+            report += f"  - {tag}: {count} posts\n"
+        
+        comments_by_hour = engagement_analysis.get('comment_stats', {}).get('comments_by_hour', {})
+        busiest_hour = 'N/A'
+        if any(comments_by_hour.values()):
+            hour, count = max(comments_by_hour.items(), key=lambda x: x[1])
+            busiest_hour = f"{hour}:00 ({count} comments)"
+        
+        report += f"""
+## Engagement Analysis
+
+### Overall Engagement
+- **Average Engagement Rate:** {engagement_analysis.get('engagement_rate_stats', {}).get('average', 0):.2f}%
+- **Median Engagement Rate:** {engagement_analysis.get('engagement_rate_stats', {}).get('median', 0):.2f}%
+- **90th Percentile Engagement Rate:** {engagement_analysis.get('engagement_rate_stats', {}).get('p90', 0):.2f}%
+- **Best Engagement Rate:** {engagement_analysis.get('engagement_rate_stats', {}).get('max', 0):.2f}%
+
+### Comment Statistics
+- **Total Approved Comments:** {engagement_analysis.get('comment_stats', {}).get('total_comments', 0)}
+- **Average Comment Length:** {engagement_analysis.get('comment_stats', {}).get('average_length', 0)} characters
+- **Median / 90th Percentile Comment Length:** {engagement_analysis.get('comment_stats', {}).get('length_percentiles', {}).get('median', 0)} / {engagement_analysis.get('comment_stats', {}).get('length_percentiles', {}).get('p90', 0)} characters
+- **Posts with Comments:** {engagement_analysis.get('comment_stats', {}).get('posts_with_comments', 0)}
+- **Busiest Comment Hour:** {busiest_hour}
+- **Median Time to First Comment:** {engagement_analysis.get('comment_stats', {}).get('first_response_hours', {}).get('median', 0)} hours
+
+### Most Engaging Posts
+"""
+        
+        for i, post in enumerate(engagement_analysis.get('most_engaging_posts', [])[:5], 1):
+            report += f"{i}. **{post['title']}** - {post['views']} views, {post['comments']} comments, {post['likes']} likes\n"
+        
+        report += f"""
+## Category Performance
+"""
+        
+        for category, stats in category_performance.items():
+            report += f"""
+### {category.title()}
+- **Posts:** {stats['posts']}
+- **Total Views:** {stats['total_views']:,}
+- **Average Views:** {stats['average_views']:.1f}
+- **Total Comments:** {stats['total_comments']}
+- **Average Comments:** {stats['average_comments']:.1f}
+- **Approved Comments:** {stats['approved_comments']}
+- **Total Likes:** {stats['total_likes']}
+- **Average Likes:** {stats['average_likes']:.1f}
+"""
+        
+        report += f"""
+## Publishing Patterns
+
+### Frequency
+- **Average Posts per Month:** {temporal_analysis.get('average_posts_per_month', 0):.1f}
+- **Most Productive Month:** {temporal_analysis.get('most_productive_month', 'N/A')}
+- **Most Productive Day:** {temporal_analysis.get('most_productive_weekday', 'N/A')}
+- **Most Productive Week:** {temporal_analysis.get('most_productive_week', 'N/A')}
+
+### Posts by Day of Week
+"""
+        
+        posts_by_weekday = temporal_analysis.get('posts_by_weekday', {})
+        for day, count in posts_by_weekday.items():
+            report += f"- {day}: {count} posts\n"
+        
+        report += f"""
+## Top Performing Content
+
+### Most Viewed Posts
+"""
+        
+        for i, post in enumerate(top_content.get('top_by_views', [])[:5], 1):
+            report += f"{i}. **{post['title']}** - {post['views']:,} views ({post['date']})\n"
+        
+        report += f"""
+### Most Commented Posts
+"""
+        
+        for i, post in enumerate(top_content.get('top_by_comments', [])[:5], 1):
+            report += f"{i}. **{post['title']}** - {post['comments']} comments ({post['date']})\n"
+        
+        report += f"""
+### Highest Engagement Score
+"""
+        
+        for i, post in enumerate(top_content.get('top_by_engagement', [])[:5], 1):
+            report += f"{i}. **{post['title']}** - Score: {post['engagement_score']} ({post['views']} views, {post['comments']} comments, {post['likes']} likes)\n"
+        
+        report += f"""
+## SEO Analysis
+
+### Title Optimization
+- **Average Title Length:** {seo_analysis.get('title_analysis', {}).get('average_length', 0):.1f} characters
+- **Optimal Length Titles (50-60 chars):** {seo_analysis.get('title_analysis', {}).get('optimal_length_count', 0)} ({seo_analysis.get('title_analysis', {}).get('optimal_percentage', 0):.1f}%)
+
+### Meta Description Optimization
+- **Average Meta Description Length:** {seo_analysis.get('meta_description_analysis', {}).get('average_length', 0):.1f} characters
+- **Optimal Length Descriptions (150-160 chars):** {seo_analysis.get('meta_description_analysis', {}).get('optimal_length_count', 0)} ({seo_analysis.get('meta_description_analysis', {}).get('optimal_percentage', 0):.1f}%)
+
+### Content Optimization
+- **Posts with Featured Images:** {seo_analysis.get('content_optimization', {}).get('posts_with_images', 0)} ({seo_analysis.get('content_optimization', {}).get('posts_with_images_percentage', 0):.1f}%)
+- **Posts with Tags:** {seo_analysis.get('content_optimization', {}).get('posts_with_tags', 0)} ({seo_analysis.get('content_optimization', {}).get('posts_with_tags_percentage', 0):.1f}%)
+
+## Key Insights and Recommendations
+"""
+        
+        for insight in insights:
+            report += f"- {insight}\n"
+        
+        report += f"""
+## Recommendations for Growth
+
+### Content Strategy
+1. **Consistency:** Maintain regular publishing schedule (aim for 3-4 posts per month)
+2. **Length:** Target 1000-2000 words per post for better SEO performance
+3. **Engagement:** End posts with questions to encourage comments
+4. **Visuals:** Include featured images in all posts
+
+### SEO Optimization
+1. **Titles:** Keep titles between 50-60 characters for optimal search display
+2. **Meta Descriptions:** Write compelling 150-160 character descriptions
+3. **Tags:** Use 3-5 relevant tags per post
+4. **Internal Linking:** Link between related posts to improve site structure
+
+### Audience Engagement
+1. **Comments:** Respond to comments promptly to encourage discussion
+2. **Social Media:** Share posts across social platforms
+3. **Email:** Build an email list for direct reader communication
+4. **Community:** Engage with other bloggers in your niche
+
+### Analytics Tracking
+1. **Monitor:** Track these metrics monthly to identify trends
+2. **A/B Test:** Experiment with different post formats and topics
+3. **User Feedback:** Survey readers about content preferences
+4. **Performance:** Focus on replicating successful content patterns
+
+---
+*Report generated by Blog Analytics System*
+"""
+        
+        if output_file:
+            with self._stage('write_report'):
+                with open(output_file, 'w') as f:
+                    f.write(report)
+            print(f"Report saved to: {output_file}")
+        else:
+            print(report)
+        
+        return report
+    
+    def export_to_csv(self, output_dir=None, file_format='csv', columns=None,
+                      chunk_size=EXPORT_CHUNK_SIZE, compression=None):
+        """Export data to CSV (or Parquet/Feather) files for external analysis; returns {name: file}
+        
+        Rows are streamed chunk_size at a time; columns keeps only the named
+        columns of each file. compression defaults to zstd for Parquet and lz4
+        for Feather; CSV files are gzipped with compression='gzip'.
+        """
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format {file_format!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+        if output_dir is None:
+            output_dir = self.data_dir / '../reports'
+        else:
+            output_dir = Path(output_dir)
+        
+        output_dir.mkdir(exist_ok=True)
+        
+        suffix, default_compression = EXPORT_FORMATS[file_format]
+        if compression is None:
+            compression = default_compression
+        elif file_format == 'csv' and compression != 'gzip':
+            raise ValueError(f"CSV exports only support gzip compression, got {compression!r}")
+        if file_format == 'csv' and compression == 'gzip':
+            suffix += '.gz'
+        
+        exported = {}
+        for name, records in (('posts', self.posts), ('comments', self.comments), ('categories', self.categories)):
+            if not records:
+                continue
+            if isinstance(records, RecordList):
+                # Compact records lack the bodies: stream the full records instead
+                records = records.source
+            
+            table_columns = export_columns(records, columns)
+            if not table_columns:
+                print(f"No selected columns in {name}; skipping export")
+                continue
+            
+            with self._stage(f'export_{name}') as stage:
+                export_file = output_dir / f'blog_{name}_export{suffix}'
+                stage.records = write_export(records, export_file, file_format, table_columns,
+                                             chunk_size, compression)
+            print(f"{name.capitalize()} exported to: {export_file}")
+            exported[name] = export_file
+        return exported
+
+def positive_int(value):
+    """Parse a positive integer query parameter"""
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"Expected a positive integer, got {value}")
+    return number
+
+def post_id_param(params):
+    """The id query parameter, as an integer when it is one"""
+    if 'id' not in params:
+        raise ValueError("Missing id parameter")
+    value = params['id']
+    return int(value) if value.lstrip('-').isdigit() else value
+
+def term_param(params):
+    """The q query parameter (keywords)"""
+    if not params.get('q'):
+        raise ValueError("Missing q parameter")
+    return params['q']
+
+def filter_params(params):
+    """Section filters (start, end, category, published) given as query parameters"""
+    filters = {name: params[name] for name in ('start', 'end', 'category') if name in params}
+    if 'published' in params:
+        value = params['published'].lower()
+        if value not in ('true', 'false', '1', '0'):
+            raise ValueError(f"Expected true or false for published, got {params['published']}")
+        filters['published'] = value in ('true', '1')
+    return filters
+
+# Queries answered by the serve command: name -> (analytics, query parameters) -> result
+SERVE_QUERIES = {
+    'overview': lambda analytics, params: analytics.get_blog_overview(**filter_params(params)),
+    'insights': lambda analytics, params: analytics.generate_insights(**filter_params(params)),
+    'category': lambda analytics, params: analytics.get_category_performance(**filter_params(params)),
+    'temporal': lambda analytics, params: analytics.get_temporal_analysis(**filter_params(params)),
+    'top': lambda analytics, params: analytics.get_top_performing_content(positive_int(params.get('k', analytics.top_k)),
+                                                                          **filter_params(params)),
+    'content': lambda analytics, params: analytics.get_content_analysis(**filter_params(params)),
+    'engagement': lambda analytics, params: analytics.get_engagement_analysis(**filter_params(params)),
+    'post_comments': lambda analytics, params: analytics.get_post_comment_stats(post_id_param(params),
+                                                                                **filter_params(params)),
+    'seo': lambda analytics, params: analytics.get_seo_analysis(**filter_params(params)),
+    'keyword': lambda analytics, params: analytics.get_keyword_performance(term_param(params),
+                                                                            positive_int(params.get('k', 5))),
+    'topics': lambda analytics, params: analytics.get_category_terms(positive_int(params.get('n', 10)))
+}
+
+def make_request_handler(analytics, lock):
+    """HTTP handler answering GET /<query> from a resident BlogAnalytics with JSON"""
+    from http.server import BaseHTTPRequestHandler
+    from urllib.parse import urlparse, parse_qsl
+    
+    class AnalyticsRequestHandler(BaseHTTPRequestHandler):
+        def send_json(self, status, data):
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def do_GET(self):
+            url = urlparse(self.path)
+            name = url.path.strip('/')
+            if not name:
+                self.send_json(200, {'queries': sorted(SERVE_QUERIES)})
+                return
+            
+            query = SERVE_QUERIES.get(name)
+            if query is None:
+                self.send_json(404, {'error': f"Unknown query: {name}", 'queries': sorted(SERVE_QUERIES)})
+                return
+            
+            try:
+                with lock:
+                    result = query(analytics, dict(parse_qsl(url.query)))
+            except ValueError as e:
+                self.send_json(400, {'error': str(e)})
+                return
+            except Exception as e:
+                self.send_json(500, {'error': f"{type(e).__name__}: {e}"})
+                return
+            self.send_json(200, result)
+    
+    return AnalyticsRequestHandler
+
+def watch_data_files(analytics, lock, poll_interval, stop):
+    """Recompute the analytics in the background whenever the data files change"""
+    while not stop.wait(poll_interval):
+        with lock:
+            if analytics._data_signature() != analytics._signature:
+                analytics.invalidate()
+                analytics.warm()
+
+def serve(analytics, host='127.0.0.1', port=8765, poll_interval=2.0):
+    """Answer analytics queries over HTTP, keeping the data and results in memory"""
+    from http.server import ThreadingHTTPServer
+    
+    lock = threading.Lock()
+    analytics.warm()
+    
+    server = ThreadingHTTPServer((host, port), make_request_handler(analytics, lock))
+    stop = threading.Event()
+    watcher = threading.Thread(target=watch_data_files, args=(analytics, lock, poll_interval, stop), daemon=True)
+    watcher.start()
+    
+    print(f"Serving blog analytics on http://{host}:{server.server_address[1]}/ "
+          f"({', '.join(sorted(SERVE_QUERIES))})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+# Commands that can be batched with run (serve runs on its own)
+BATCH_COMMANDS = ('report', 'visualize', 'export', 'insights', 'overview', 'keyword', 'topics', 'partial', 'merge')
+OUTPUT_FORMATS = ('text', 'json', 'ndjson')
+
+def main():
+    """Main function for command-line usage"""
+    parser = argparse.ArgumentParser(description='Personal Blog Analytics')
+    parser.add_argument('command', nargs='?',
+                        help='report, visualize, export, insights, overview, keyword, topics, partial, merge, serve '
+                             'or run (several commands over one load of the data)')
+    parser.add_argument('target', nargs='*',
+                        help='output file (report, partial, merge), output directory (visualize, export) '
+                             'or search terms (keyword); for run, the commands as NAME or NAME=TARGET')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                        help='output of the commands: text, one JSON document, or one JSON record per '
+                             'command as it completes (ndjson); progress messages then go to stderr')
+    parser.add_argument('--data-dir', default=None,
+                        help='directory holding posts.json, comments.json, categories.json and settings.json')
+    parser.add_argument('--cache-dir', default=os.environ.get('BLOG_ANALYTICS_CACHE_DIR'),
+                        help='keep computed results on disk between runs (env: BLOG_ANALYTICS_CACHE_DIR)')
+    parser.add_argument('--engine', choices=['auto', 'python', 'numpy'], default='auto',
+                        help='statistics engine; auto uses NumPy columns for large archives when available')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='worker processes for text analysis (0: one per CPU)')
+    parser.add_argument('--dpi', type=int, default=300,
+                        help='resolution of the visualize images (e.g. 72 for quick previews)')
+    parser.add_argument('--image-format', choices=IMAGE_FORMATS, default='png',
+                        help='file format of the visualize images')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='address the serve command listens on')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='port the serve command listens on')
+    parser.add_argument('--poll-interval', type=float, default=2.0,
+                        help='seconds between checks of the data files while serving')
+    parser.add_argument('--backend', choices=['json', 'sqlite'], default='json',
+                        help='sqlite keeps an indexed copy of the data files and answers the sections with SQL')
+    parser.add_argument('--db', default=None, metavar='FILE',
+                        help='SQLite file of the sqlite backend (default: in --cache-dir, else the data directory)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='save the aggregate in --cache-dir and only process what changed since the last run')
+    parser.add_argument('--top-k', type=int, default=10,
+                        help='posts per top performing content list (terms per category for topics)')
+    parser.add_argument('--quantile-error', type=float, default=None, metavar='EPS',
+                        help='rank error bound of the streaming quantile sketches, e.g. 0.01 (default: 0.025)')
+    parser.add_argument('--partial', action='append', default=[], metavar='FILE',
+                        help='shard partial written by the partial command; repeat to merge several')
+    parser.add_argument('--start', type=date.fromisoformat, default=None, metavar='YYYY-MM-DD',
+                        help='only posts published and comments written on or after this date')
+    parser.add_argument('--end', type=date.fromisoformat, default=None, metavar='YYYY-MM-DD',
+                        help='only posts published and comments written on or before this date')
+    parser.add_argument('--category', default=None,
+                        help='only posts in this category (and their comments)')
+    published = parser.add_mutually_exclusive_group()
+    published.add_argument('--published', dest='published', action='store_const', const=True, default=None,
+                           help='only published posts (and their comments)')
+    published.add_argument('--drafts', dest='published', action='store_const', const=False,
+                           help='only draft posts (and their comments)')
+    parser.add_argument('--export-format', choices=list(EXPORT_FORMATS), default='csv',
+                        help='file format of the export command (parquet and feather need pyarrow)')
+    parser.add_argument('--columns', type=lambda value: [column.strip() for column in value.split(',') if column.strip()],
+                        default=None, metavar='COL,COL',
+                        help='only export these columns')
+    parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE,
+                        help='rows written per chunk by the export command')
+    parser.add_argument('--compression', default=None,
+                        help='export compression (default: zstd for parquet, lz4 for feather, none for csv; gzip for csv)')
+    parser.add_argument('--profile', action='store_true',
+                        help='print per-stage timings, call counts, records and allocation peaks (to stderr)')
+    parser.add_argument('--profile-json', default=None, metavar='FILE',
+                        help='also write the per-stage profile as JSON (implies --profile)')
+    parser.add_argument('--profile-pstats', default=None, metavar='FILE',
+                        help='also run the command under cProfile and dump the stats for pstats (implies --profile)')
+    args = parser.parse_args()
+    if args.command and args.command.lower() == 'run':
+        if not args.target:
+            parser.error('run needs at least one command, e.g.: run overview insights report=report.md')
+        args.commands = [parse_batch_command(entry) for entry in args.target]
+        unknown = [command for command, _ in args.commands if command not in BATCH_COMMANDS]
+        if unknown:
+            parser.error(f"run cannot batch {', '.join(unknown)} (commands: {', '.join(BATCH_COMMANDS)})")
+        args.target = None
+    elif args.command and args.command.lower() == 'keyword':
+        args.target = ' '.join(args.target) or None
+    elif len(args.target) > 1:
+        parser.error(f"{args.command or 'the default command'} takes at most one target; "
+                     f"use run to combine several commands")
+    else:
+        args.target = args.target[0] if args.target else None
+    if args.export_format == 'csv' and args.compression not in (None, 'gzip'):
+        parser.error('CSV exports only support --compression gzip')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if args.top_k < 1:
+        parser.error('--top-k must be at least 1')
+    if args.quantile_error is not None and not 0 < args.quantile_error < 1:
+        parser.error('--quantile-error must be between 0 and 1')
+    profile = args.profile or args.profile_json is not None or args.profile_pstats is not None
+    filters = {'start': args.start, 'end': args.end, 'category': args.category, 'published': args.published}
+    
+    if args.partial:
+        analytics = BlogAnalytics.from_partials(args.partial, data_dir=args.data_dir, engine=args.engine,
+                                                workers=args.workers, top_k=args.top_k, profile=profile)
+    else:
+        analytics = BlogAnalytics(args.data_dir, cache_dir=args.cache_dir, engine=args.engine,
+                                  workers=args.workers, top_k=args.top_k, incremental=args.incremental,
+                                  backend=args.backend, db_file=args.db, profile=profile,
+                                  quantile_error=args.quantile_error)
+    
+    cprofile = None
+    if args.profile_pstats:
+        import cProfile
+        cprofile = cProfile.Profile()
+        cprofile.enable()
+    
+    failed = run_command(analytics, args, filters)
+    
+    if cprofile is not None:
+        cprofile.disable()
+        cprofile.dump_stats(args.profile_pstats)
+        print(f"cProfile stats saved to: {args.profile_pstats}", file=sys.stderr)
+    if profile:
+        print(analytics.profiler.summary(), file=sys.stderr)
+    if args.profile_json:
+        with open(args.profile_json, 'w') as f:
+            json.dump(analytics.profiler.to_dict(), f, indent=2)
+        print(f"Profile saved to: {args.profile_json}", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+def parse_batch_command(entry):
+    """Split a run entry NAME[=TARGET] into (name, target)"""
+    command, _, target = entry.partition('=')
+    return command.lower(), target or None
+
+def command_result(analytics, command, target, args, filters):
+    """Run one command and return its result as JSON-serializable data"""
+    if command == 'report':
+        report = analytics.generate_report(target, **filters)
+        return {'file': target} if target else {'report': report}
+    
+    if command == 'visualize':
+        files = analytics.create_visualizations(target, dpi=args.dpi, image_format=args.image_format)
+        return {'files': [str(path) for path in files]}
+    
+    if command == 'export':
+        exported = analytics.export_to_csv(target, args.export_format, args.columns,
+                                           args.chunk_size, args.compression)
+        return {'files': {name: str(path) for name, path in exported.items()}}
+    
+    if command == 'partial':
+        data = analytics.write_partial(target)
+        return {'file': target} if target else json.loads(data)
+    
+    if command == 'merge':
+        if not args.partial:
+            raise ValueError("The merge command needs at least one --partial FILE")
+        report = analytics.generate_report(target)
+        return {'file': target} if target else {'report': report}
+    
+    if command == 'insights':
+        return analytics.generate_insights(**filters)
+    
+    if command == 'overview':
+        return analytics.get_blog_overview(**filters)
+    
+    if command == 'keyword':
+        if not target:
+            raise ValueError("The keyword command needs a term, e.g.: keyword python")
+        return analytics.get_keyword_performance(target)
+    
+    if command == 'topics':
+        return analytics.get_category_terms(args.top_k)
+    
+    raise ValueError("Unknown command. Available commands: report, visualize, export, insights, overview, keyword, "
+                     "topics, partial, merge, serve, run")
+
+def print_command_result(command, result):
+    """Print a command result as text (report, visualize, export, partial and merge print as they go)"""
+    if command == 'insights':
+        print("Blog Insights:")
+        print("=" * 20)
+        for insight in result:
+            print(f"  {insight}")
+    
+    elif command == 'overview':
+        print("Blog Overview:")
+        print("=" * 20)
+        for key, value in result.items():
+            print(f"{key.replace('_', ' ').title()}: {value}")
+    
+    elif command == 'keyword':
+        print(f"Posts mentioning {' '.join(result['terms'])}:")
+        print("=" * 20)
+        for key, value in result.items():
+            if key not in ('terms', 'top_posts'):
+                print(f"{key.replace('_', ' ').title()}: {value}")
+        for post in result['top_posts']:
+            print(f"  {post['title']} - {post['views']:,} views")
+    
+    elif command == 'topics':
+        print("Top Terms by Category (TF-IDF):")
+        print("=" * 20)
+        for category, terms in result.items():
+            print(f"{category}: {', '.join(terms)}")
+
+def run_command(analytics, args, filters):
+    """Run the command(s) given on the command line; returns how many failed
+    
+    The commands of a batch share one BlogAnalytics, so the data is loaded and
+    each aggregate computed once; a failing command is reported as an error
+    record and the batch continues. With --format json or ndjson the results go
+    to stdout as JSON (ndjson: one record per command, written as soon as it
+    completes) and every progress message goes to stderr.
+    """
+    command = args.command.lower() if args.command else None
+    output_format = getattr(args, 'format', 'text')
+    
+    if command == 'serve':
+        serve(analytics, args.host, args.port, args.poll_interval)
+        return 0
+    
+    if command == 'run':
+        commands = args.commands
+    elif command:
+        commands = [(command, args.target)]
+    elif output_format == 'text':
+        # Default: show overview and insights
+        print("Personal Blog Analytics")
+        print("=" * 25)
+        overview = analytics.get_blog_overview(**filters)
+        for key, value in overview.items():
+            print(f"{key.replace('_', ' ').title()}: {value}")
+        
+        print("\nKey Insights:")
+        insights = analytics.generate_insights(**filters)
+        for insight in insights:
+            print(f"  {insight}")
+        return 0
+    else:
+        commands = [('overview', None), ('insights', None)]
+    
+    out = sys.stdout
+    records = []
+    failed = 0
+    for name, target in commands:
+        record = {'command': name}
+        if target is not None and command == 'run':
+            record['target'] = target
+        try:
+            with redirect_stdout(sys.stderr) if output_format != 'text' else nullcontext():
+                record['result'] = command_result(analytics, name, target, args, filters)
+        except ValueError as e:
+            record['error'] = str(e)
+            failed += 1
+        except Exception as e:
+            # Any other failure is reported too, and the batch goes on with the next command
+            record['error'] = f"{type(e).__name__}: {e}"
+            failed += 1
+        
+        if output_format == 'ndjson':
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+            out.flush()
+        elif output_format == 'json':
+            records.append(record)
+        elif 'error' in record:
+            print(record['error'])
+        else:
+            print_command_result(name, record['result'])
+    
+    if output_format == 'json':
+        # A single command prints its bare result; a batch prints one record per command
+        if command not in (None, 'run'):
+            data = records[0].get('result', {'error': records[0].get('error')})
+        else:
+            data = records
+        out.write(json.dumps(data, ensure_ascii=False, indent=2, default=str) + '\n')
+    return failed
+
+if __name__ == "__main__":
+    main()
+